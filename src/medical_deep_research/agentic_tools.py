@@ -8,10 +8,13 @@ functions in their SDK's tool format.  The functions operate on a shared
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 import logging
 import os
 import re
+import time
+from functools import lru_cache
 from typing import Any
 
 import httpx
@@ -48,7 +51,7 @@ from .research import (
     verify_studies,
 )
 from .progress import ProgressTracker
-from .research.models import QueryPlan, ScoredStudy, SearchProviderResult, VerificationSummary
+from .research.models import EvidenceStudy, QueryPlan, ScoredStudy, SearchProviderResult, VerificationSummary
 from .research.fulltext import fetch_europe_pmc_fulltext_xml
 from .research.planning import (
     is_ai_communication_education_query,
@@ -111,6 +114,12 @@ def _debug_jsonable(value: Any, *, _depth: int = 0) -> Any:
 
     return str(value)
 
+
+def _clip_input_value(value: Any) -> Any:
+    """Clip a tool-input value for trace summaries, stringifying it once."""
+    text = str(value)
+    return text[:120] + "..." if len(text) > 120 else value
+
 # ---------------------------------------------------------------------------
 # Event bridge — provider-agnostic shared state + event queue
 # ---------------------------------------------------------------------------
@@ -182,6 +191,7 @@ class AgenticEventBridge:
         self._pdf_url_alternatives: dict[int, list[str]] = {}
         self._pdf_bytes: dict[int, bytes] = {}
         self._pdf_sources: dict[int, str] = {}
+        self._executed_searches: set[tuple[str, str, int]] = set()
 
         # Tool name mapping: runtime-specific name → bare name.
         # Populated by provider builder if it uses namespaced names.
@@ -217,8 +227,10 @@ class AgenticEventBridge:
         self._tool_call_count += 1
         input_summary = {}
         if tool_input:
-            input_summary = {k: (str(v)[:120] + "..." if len(str(v)) > 120 else v) for k, v in tool_input.items()}
-        _log.info("[AGENT CALL #%d] %s  input=%s", self._tool_call_count, tool_name, json.dumps(input_summary, default=str))
+            input_summary = {k: _clip_input_value(v) for k, v in tool_input.items()}
+        if _log.isEnabledFor(logging.INFO):
+            # json.dumps of the summary is log-only work; skip it when filtered.
+            _log.info("[AGENT CALL #%d] %s  input=%s", self._tool_call_count, tool_name, json.dumps(input_summary, default=str))
         extra: dict[str, Any] = {"tool_input": input_summary}
         if self.full_trace_enabled and tool_input is not None:
             extra["full_tool_input"] = _debug_jsonable(tool_input)
@@ -236,8 +248,10 @@ class AgenticEventBridge:
     async def on_tool_end(self, tool_name: str, response: Any = None) -> None:
         phase, _ = self.progress.enter(self._phase_for(tool_name))
         resp_str = str(response) if response else "<empty>"
-        resp_preview = resp_str[:300] + "..." if len(resp_str) > 300 else resp_str
-        _log.info("[AGENT RESULT #%d] %s  response_len=%d  preview=%s", self._tool_call_count, tool_name, len(resp_str), resp_preview)
+        if _log.isEnabledFor(logging.INFO):
+            # The preview copy exists only for this log line.
+            resp_preview = resp_str[:300] + "..." if len(resp_str) > 300 else resp_str
+            _log.info("[AGENT RESULT #%d] %s  response_len=%d  preview=%s", self._tool_call_count, tool_name, len(resp_str), resp_preview)
         bare = self._bare_name(tool_name)
         if bare in (
             "get_studies",
@@ -257,8 +271,13 @@ class AgenticEventBridge:
             for key in ("error", "issues", "warnings", "fatal", "fallback_reason", "rejection_count"):
                 if key in response:
                     extra[key] = _debug_jsonable(response[key])
+        # _debug_jsonable walks the whole response tree; compute it at most
+        # once per call even when both the trace extra and the full-text
+        # artifact below need it.
+        jsonable_response: Any = None
         if self.full_trace_enabled:
-            extra["full_tool_output"] = _debug_jsonable(response)
+            jsonable_response = _debug_jsonable(response)
+            extra["full_tool_output"] = jsonable_response
         await self.queue.put(
             RuntimeEventPayload(
                 event_type=EventType.TOOL_RESULT,
@@ -270,6 +289,8 @@ class AgenticEventBridge:
             )
         )
         if bare == "fetch_fulltext" and isinstance(response, dict):
+            if jsonable_response is None:
+                jsonable_response = _debug_jsonable(response)
             await self.queue.put(
                 RuntimeEventPayload(
                     event_type=EventType.ARTIFACT_CREATED,
@@ -278,7 +299,7 @@ class AgenticEventBridge:
                     message="Saved full-text PDF status",
                     artifact_type=ArtifactType.FULLTEXT_STATUS,
                     artifact_name="Full Text PDF Status",
-                    artifact_json=_debug_jsonable(response),
+                    artifact_json=jsonable_response,
                 )
             )
         if bare == "finalize_ranking" and self.ranked_studies:
@@ -452,7 +473,39 @@ async def tool_suggest_databases(request: RunRequest, bridge: AgenticEventBridge
     return {"databases": dbs}
 
 
+def _search_study_summary(s: EvidenceStudy) -> dict[str, Any]:
+    """Compact one raw search hit for the agent's tool response."""
+    # Truncate before normalising so summaries never copy a full abstract.
+    abstract = (s.abstract or "").strip()
+    if len(abstract) > 300:
+        abstract = abstract[:300] + "..."
+    abstract = abstract.replace("\n", " ")
+    title = s.title or ""
+    return {
+        "title": title[:200] + "..." if len(title) > 200 else title,
+        "journal": s.journal,
+        "year": s.publication_year,
+        "pmid": s.pmid,
+        "pmcid": s.pmcid,
+        "doi": s.doi,
+        "evidence_level": s.evidence_level,
+        "citation_count": s.citation_count,
+        "abstract": abstract,
+    }
+
+
 async def tool_search(request: RunRequest, bridge: AgenticEventBridge, source: str, query: str, max_results: int = 15) -> dict[str, Any]:
+    # Agents occasionally repeat a search verbatim; skip the provider call and
+    # the duplicate result-pool entry instead of paying for it twice.
+    search_key = (source.strip().lower(), " ".join(query.split()).lower(), max_results)
+    if search_key in bridge._executed_searches:
+        return {
+            "source": source,
+            "count": 0,
+            "error": None,
+            "studies": [],
+            "note": "Duplicate search skipped — this source/query was already executed in this run.",
+        }
     result = await search_source(
         source, query,
         api_keys=request.api_keys,
@@ -462,22 +515,12 @@ async def tool_search(request: RunRequest, bridge: AgenticEventBridge, source: s
         start_year=request.search_start_year,
         scopus_view=request.scopus_view,
     )
+    # Only a search that actually ran counts as executed: a transient provider
+    # failure (timeout, 429, open circuit) must stay retryable verbatim.
+    if not result.error and not result.skipped:
+        bridge._executed_searches.add(search_key)
     bridge.search_results.append(result)
-    studies_summary = []
-    for s in result.studies:
-        abstract = (s.abstract or "").replace("\n", " ").strip()
-        title = s.title or ""
-        studies_summary.append({
-            "title": title[:200] + "..." if len(title) > 200 else title,
-            "journal": s.journal,
-            "year": s.publication_year,
-            "pmid": s.pmid,
-            "pmcid": s.pmcid,
-            "doi": s.doi,
-            "evidence_level": s.evidence_level,
-            "citation_count": s.citation_count,
-            "abstract": abstract[:300] + "..." if len(abstract) > 300 else abstract,
-        })
+    studies_summary = [_search_study_summary(s) for s in result.studies]
     return {"source": result.source, "count": len(result.studies), "error": result.error, "studies": studies_summary}
 
 
@@ -501,11 +544,13 @@ _PCC_AI_COMMUNICATION_REQUIRED_SOURCES = (
 )
 
 
+@lru_cache(maxsize=64)
 def _evidence_level_rank(level: str | None) -> int:
     """Map "Level I".."Level V" to 1..5 (unknown -> 6).
 
     Check the longer substrings (iii/iv/v) before the shorter (ii/i) so that a
-    Level III study is not matched as "level i".
+    Level III study is not matched as "level i".  Cached: the label vocabulary
+    is a handful of strings but this runs per study on every sort and filter.
     """
     if not level:
         return 6
@@ -524,11 +569,15 @@ def _evidence_level_rank(level: str | None) -> int:
 
 
 def _study_card(s: ScoredStudy) -> dict[str, Any]:
-    abstract = (s.abstract or "").replace("\n", " ").strip()
+    # Truncate before normalising so card builds never copy a full abstract.
+    abstract = (s.abstract or "").strip()
+    if len(abstract) > 500:
+        abstract = abstract[:500] + "..."
+    abstract = abstract.replace("\n", " ")
     return {
         "idx": s.reference_number,  # stable composite-rank index across pages
         "title": s.title,
-        "abstract": abstract[:500] + "..." if len(abstract) > 500 else abstract,
+        "abstract": abstract,
         "journal": s.journal,
         "year": s.publication_year,
         "pmid": s.pmid,
@@ -1105,6 +1154,34 @@ _NUMBERED_REPORT_SECTIONS: tuple[tuple[int, str], ...] = (
 )
 
 
+# Heading parsing runs on every submit_report QA pass; compile the shared
+# prefixes once and cache one alternation per alias tuple instead of building
+# a fresh pattern per alias per line.
+_HEADING_PREFIX_RE = re.compile(r"^#{1,6}\s*")
+_NUMBER_PREFIX_RE = re.compile(r"^\d+[.)]\s*")
+_HEADING_LINE_RE = re.compile(r"^\s*#{1,6}\s+")
+
+
+@lru_cache(maxsize=None)
+def _alias_start_pattern(aliases: tuple[str, ...]) -> re.Pattern[str]:
+    alternation = "|".join(re.escape(alias.lower()) for alias in aliases)
+    return re.compile(rf"^(?:{alternation})\b")
+
+
+@lru_cache(maxsize=None)
+def _section_heading_patterns(aliases: tuple[str, ...]) -> tuple[re.Pattern[str], re.Pattern[str]]:
+    alternation = "|".join(re.escape(alias.lower()) for alias in aliases)
+    return (
+        re.compile(rf"(^|\n)\s*#+\s*(?:\d+[.)]?\s*)?(?:{alternation})\b"),
+        re.compile(rf"(^|\n)\s*(?:\d+[.)]\s*)?(?:{alternation})\s*$"),
+    )
+
+
+@lru_cache(maxsize=None)
+def _numbered_heading_pattern(number: int) -> re.Pattern[str]:
+    return re.compile(rf"^{number}[.)]\s*(.+)$")
+
+
 def _report_word_count(text: str) -> int:
     """Approximate report length across English and common CJK report text."""
     tokens = re.findall(
@@ -1115,13 +1192,8 @@ def _report_word_count(text: str) -> int:
 
 
 def _has_report_section(text_lower: str, aliases: tuple[str, ...]) -> bool:
-    for alias in aliases:
-        escaped = re.escape(alias.lower())
-        if re.search(rf"(^|\n)\s*#+\s*(?:\d+[.)]?\s*)?{escaped}\b", text_lower):
-            return True
-        if re.search(rf"(^|\n)\s*(?:\d+[.)]\s*)?{escaped}\s*$", text_lower):
-            return True
-    return False
+    heading_pattern, bare_pattern = _section_heading_patterns(aliases)
+    return bool(heading_pattern.search(text_lower) or bare_pattern.search(text_lower))
 
 
 def _has_report_title(report_markdown: str) -> bool:
@@ -1134,16 +1206,17 @@ def _has_report_title(report_markdown: str) -> bool:
 
 
 def _has_numbered_report_section(report_markdown: str, number: int, aliases: tuple[str, ...]) -> bool:
+    number_pattern = _numbered_heading_pattern(number)
+    alias_pattern = _alias_start_pattern(aliases)
     for line in report_markdown.splitlines():
         stripped = line.strip().lower()
         if not stripped:
             continue
-        heading = re.sub(r"^#{1,6}\s*", "", stripped)
-        match = re.match(rf"^{number}[.)]\s*(.+)$", heading)
+        heading = _HEADING_PREFIX_RE.sub("", stripped)
+        match = number_pattern.match(heading)
         if not match:
             continue
-        stripped = match.group(1).strip()
-        if any(re.search(rf"^{re.escape(alias.lower())}\b", stripped) for alias in aliases):
+        if alias_pattern.search(match.group(1).strip()):
             return True
     return False
 
@@ -1165,9 +1238,9 @@ def _numbered_report_section_issues(report_markdown: str) -> list[str]:
 
 def _heading_matches(line: str, aliases: tuple[str, ...]) -> bool:
     lowered = line.strip().lower()
-    lowered = re.sub(r"^#{1,6}\s*", "", lowered)
-    lowered = re.sub(r"^\d+[.)]\s*", "", lowered)
-    return any(re.search(rf"^{re.escape(alias.lower())}\b", lowered) for alias in aliases)
+    lowered = _HEADING_PREFIX_RE.sub("", lowered)
+    lowered = _NUMBER_PREFIX_RE.sub("", lowered)
+    return bool(_alias_start_pattern(aliases).search(lowered))
 
 
 def _extract_section(
@@ -1185,7 +1258,7 @@ def _extract_section(
         return ""
     end_index = len(lines)
     for index in range(start_index, len(lines)):
-        if re.match(r"^\s*#{1,6}\s+", lines[index]) and _heading_matches(lines[index], end_aliases):
+        if _HEADING_LINE_RE.match(lines[index]) and _heading_matches(lines[index], end_aliases):
             end_index = index
             break
         if _heading_matches(lines[index], end_aliases):
@@ -1281,7 +1354,7 @@ def _evidence_level_order_issues(report_markdown: str) -> list[str]:
 
     ordered_levels: list[int] = []
     for line in findings.splitlines():
-        if not re.match(r"^\s*#{1,6}\s+", line):
+        if not _HEADING_LINE_RE.match(line):
             continue
         match = _EVIDENCE_LEVEL_RE.search(line)
         if match:
@@ -1438,6 +1511,18 @@ async def tool_submit_report(request: RunRequest, bridge: AgenticEventBridge, re
     return {"status": "ok", "length": len(finalized_report)}
 
 
+# Agents sometimes retry translation of an identical report (rewind passes,
+# transient tool errors); memoise successful translations so the repeat does
+# not pay for a second LLM round trip.
+_TRANSLATION_CACHE: dict[tuple[str, str, str, str], tuple[float, str]] = {}
+_TRANSLATION_CACHE_TTL = 3600.0
+_TRANSLATION_CACHE_MAX = 16
+
+
+def clear_translation_cache() -> None:
+    _TRANSLATION_CACHE.clear()
+
+
 async def tool_translate_report(
     request: RunRequest,
     bridge: AgenticEventBridge,
@@ -1458,12 +1543,28 @@ async def tool_translate_report(
     provider = request.provider
     model = request.model
 
+    digest = hashlib.sha256(report_markdown.encode("utf-8")).hexdigest()
+    cache_key = (provider, model, target_language, digest)
+    now = time.monotonic()
+    cached = _TRANSLATION_CACHE.get(cache_key)
+    if cached and cached[0] > now:
+        translated = cached[1]
+        _log.info("Reusing cached translation (%d chars)", len(translated))
+        bridge._intermediate["submitted_report"] = translated
+        bridge.set_result(translated)
+        return {"status": "ok", "length": len(translated), "cached": True}
+
     try:
         _log.info("Calling LLM for translation: provider=%s model=%s", provider, model)
         translated = await _call_llm_for_translation(
             provider, model, api_keys, translation_prompt, report_markdown,
         )
         _log.info("Translation returned %d chars", len(translated))
+        if translated:
+            if len(_TRANSLATION_CACHE) >= _TRANSLATION_CACHE_MAX:
+                oldest = min(_TRANSLATION_CACHE, key=lambda key: _TRANSLATION_CACHE[key][0])
+                _TRANSLATION_CACHE.pop(oldest, None)
+            _TRANSLATION_CACHE[cache_key] = (now + _TRANSLATION_CACHE_TTL, translated)
         bridge._intermediate["submitted_report"] = translated
         bridge.set_result(translated)
         return {"status": "ok", "length": len(translated)}
@@ -1472,10 +1573,17 @@ async def tool_translate_report(
         return {"error": f"Translation failed: {exc}"}
 
 
+_TRANSLATION_LANG_NAMES = {"ko": "Korean (한국어)", "ja": "Japanese (日本語)", "zh": "Chinese (中文)"}
+
+
+@lru_cache(maxsize=8)
 def _build_translation_prompt(target_language: str) -> str:
-    lang_name = {"ko": "Korean (한국어)", "ja": "Japanese (日本語)", "zh": "Chinese (中文)"}.get(
-        target_language, target_language,
-    )
+    """Build the translation system prompt for a target language.
+
+    Cached: only the language name varies, and rewind passes re-request the
+    same language repeatedly.
+    """
+    lang_name = _TRANSLATION_LANG_NAMES.get(target_language, target_language)
 
     return f"""\
 You are a medical research translator specializing in accurate, professional translation.
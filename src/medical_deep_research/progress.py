@@ -17,6 +17,8 @@ derived from phase identity alone therefore jump backwards in the trace.
 
 from __future__ import annotations
 
+from bisect import bisect_right
+
 PHASE_ORDER: list[str] = [
     "init",
     "planning",
@@ -73,6 +75,10 @@ _MILESTONE_VALUES = sorted(set(PHASE_MILESTONES.values()) | {_HARD_CAP})
 class ProgressTracker:
     """Monotonic percent + phase pass labels for a single research run."""
 
+    # Every runtime event reads and advances the tracker, so keep instances
+    # slotted for cheaper attribute access and no per-run __dict__.
+    __slots__ = ("_percent", "_passes", "_current_phase", "_completed")
+
     def __init__(self) -> None:
         self._percent = 0
         self._passes: dict[str, int] = {}
@@ -132,7 +138,9 @@ class ProgressTracker:
 
     @staticmethod
     def _next_milestone_above(percent: int) -> int:
-        for value in _MILESTONE_VALUES:
-            if value > percent:
-                return value
+        # _MILESTONE_VALUES is sorted, so binary-search instead of scanning;
+        # this runs on every advance() call.
+        index = bisect_right(_MILESTONE_VALUES, percent)
+        if index < len(_MILESTONE_VALUES):
+            return _MILESTONE_VALUES[index]
         return _HARD_CAP
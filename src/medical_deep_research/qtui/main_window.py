@@ -27,6 +27,7 @@ from .. import __version__
 from ..config import Settings, load_settings
 from ..persistence import AppDatabase
 from ..reading_service import ReadingService
+from ..research.http import aclose_shared_client
 from ..service import ResearchService
 from ..updates import (
     GitHubUpdateService,
@@ -41,7 +42,7 @@ from .tabs.artifacts_tab import ArtifactsTab
 from .tabs.diagnostics_tab import DiagnosticsTab
 from .tabs.report_tab import ReportTab
 from .tabs.studies_tab import StudiesTab
-from .tabs.trace_tab import TraceTab
+from .tabs.trace_tab import EVENT_DISPLAY_LIMIT, TraceTab
 from .theme import (
     APP_BG,
     BORDER_DIM,
@@ -333,7 +334,7 @@ class MainWindow(QMainWindow):
             return
 
         artifacts = self._service.list_artifacts(run.id)
-        events = self._service.list_events(run.id)
+        events = self._service.list_events(run.id, limit=EVENT_DISPLAY_LIMIT)
         approvals = self._service.list_approvals(run.id)
         diag = self._service.get_run_diagnostics(run.id)
 
@@ -586,4 +587,7 @@ def run_app(
 
     with loop:
         loop.run_forever()
+        # The window has closed; release the pooled HTTP connections while the
+        # loop can still run the close handshake.
+        loop.run_until_complete(aclose_shared_client())
     return 0
@@ -119,6 +119,9 @@ class RunListPanel(QWidget):
         self._per_page = 8
         self._total = 0
         self._selected_run_id: str | None = None
+        # Fingerprint of the last rendered page; event bursts trigger
+        # refreshes far more often than the visible rows actually change.
+        self._last_fingerprint: tuple[Any, ...] | None = None
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -182,6 +185,14 @@ class RunListPanel(QWidget):
         return self._per_page
 
     def set_runs(self, runs: list[Any], total: int) -> None:
+        fingerprint = (
+            self._page,
+            total,
+            tuple((run.id, run.query, run.provider, run.model, run.status) for run in runs),
+        )
+        if fingerprint == self._last_fingerprint:
+            return
+        self._last_fingerprint = fingerprint
         self._total = total
         # Preserve selection visually after refresh
         prev_id = self._selected_run_id
@@ -58,6 +58,7 @@ class ReportTab(QWidget):
         self._t = t
         self._report_text = ""
         self._run_short_id = ""
+        self._last_rendered: tuple[str, str] | None = None
         self._headings: list[tuple[int, str]] = []
 
         layout = QVBoxLayout(self)
@@ -147,6 +148,12 @@ class ReportTab(QWidget):
         layout.addWidget(splitter, 1)
 
     def set_report(self, markdown: str, run_short_id: str) -> None:
+        # Most refresh bursts carry no report change; skip the markdown
+        # re-parse, outline rebuild, and stats recount when nothing differs.
+        key = (markdown or "", run_short_id or "")
+        if key == self._last_rendered:
+            return
+        self._last_rendered = key
         self._report_text = markdown or ""
         self._run_short_id = run_short_id or ""
         self._view.set_markdown(self._report_text or f"_{self._t('report_not_started')}_")
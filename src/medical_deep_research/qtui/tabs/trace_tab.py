@@ -14,7 +14,6 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QListWidget,
-    QListWidgetItem,
     QMessageBox,
     QPushButton,
     QVBoxLayout,
@@ -27,6 +26,10 @@ from ...reading_service import ReadingService
 from ...service import ResearchService
 from ..theme import BORDER_DIM, SURFACE, SURFACE_SOFT, TEXT_MUTED, adjusted_point_size
 
+# How many of the newest events the timeline renders; callers can fetch
+# only this many rows instead of the full trace.
+EVENT_DISPLAY_LIMIT = 200
+
 
 class TraceTab(QWidget):
     """Live execution-event timeline for the selected run."""
@@ -48,6 +51,10 @@ class TraceTab(QWidget):
         self._run: ResearchRun | None = None
         self._pdf_approval: ApprovalRequest | None = None
         self._pdf_details: dict[str, Any] = {}
+        # Incremental rendering state: events are append-only per run, so
+        # refreshes only need to add rows past the last sequence shown.
+        self._events_run_id: str | None = None
+        self._last_sequence = 0
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(8, 8, 8, 8)
@@ -97,10 +104,15 @@ class TraceTab(QWidget):
         self._rebuild_pdf_panel()
 
     def set_events(self, events: list) -> None:
-        self._count_label.setText(f"{len(events)} {self._t('events')}")
-        self._list.clear()
+        # Sequences are contiguous per run, so the newest sequence is the
+        # total count even when only the tail of the trace was fetched.
+        total = events[-1].sequence if events else 0
+        self._count_label.setText(f"{total} {self._t('events')}")
 
         if not events:
+            self._list.clear()
+            self._events_run_id = None
+            self._last_sequence = 0
             self._empty.setVisible(True)
             self._list.setVisible(False)
             return
@@ -108,17 +120,35 @@ class TraceTab(QWidget):
         self._empty.setVisible(False)
         self._list.setVisible(True)
 
-        # Show the last 200 events to keep redraws snappy.
-        for event in events[-200:]:
+        run_id = events[0].run_id
+        if run_id != self._events_run_id or total < self._last_sequence:
+            self._list.clear()
+            self._events_run_id = run_id
+            self._last_sequence = 0
+
+        # Append only the rows past the last sequence shown; rebuilding the
+        # whole list per event burst made chatty runs repaint constantly.
+        new_events = [
+            event for event in events[-EVENT_DISPLAY_LIMIT:] if event.sequence > self._last_sequence
+        ]
+        if not new_events:
+            return
+        rows: list[str] = []
+        for event in new_events:
             meta_parts = [event.phase, event.event_type, f"{event.progress}%"]
             if event.tool_name:
                 meta_parts.append(event.tool_name)
             if event.agent_name:
                 meta_parts.append(event.agent_name)
             meta = " · ".join(meta_parts)
-            text = f"{event.sequence:03d}   {event.message}\n        {meta}"
-            item = QListWidgetItem(text)
-            self._list.addItem(item)
+            rows.append(f"{event.sequence:03d}   {event.message}\n        {meta}")
+        # One bulk insert: addItems triggers a single layout/model update
+        # instead of one per row.
+        self._list.addItems(rows)
+        self._last_sequence = new_events[-1].sequence
+        # Show the newest events only to keep redraws snappy.
+        while self._list.count() > EVENT_DISPLAY_LIMIT:
+            self._list.takeItem(0)
         self._list.scrollToBottom()
 
     def retranslate(self) -> None:
@@ -60,16 +60,30 @@ class EvidenceBadge(QLabel):
         )
 
 
+# Module-level tables: the run-list delegate calls these per row on every
+# repaint, so don't rebuild the mapping per call.
+_STATUS_KINDS = {
+    "running":     "active",
+    "waiting_for_pdfs": "warn",
+    "completed":   "success",
+    "failed":      "error",
+    "cancelled":   "warn",
+    "interrupted": "warn",
+    "pending":     "neutral",
+}
+
+_EXEC_LABELS = {
+    "native_sdk": "Native SDK",
+    "native_sdk_agentic": "Agentic",
+    "codex_sdk": "Codex SDK",
+    "codex_unavailable": "Unavailable",
+    "deterministic_fallback": "Fallback",
+    "deterministic": "Deterministic",
+}
+
+
 def status_badge_kind(status: str) -> str:
-    return {
-        "running":     "active",
-        "waiting_for_pdfs": "warn",
-        "completed":   "success",
-        "failed":      "error",
-        "cancelled":   "warn",
-        "interrupted": "warn",
-        "pending":     "neutral",
-    }.get(status, "neutral")
+    return _STATUS_KINDS.get(status, "neutral")
 
 
 def exec_badge_kind(mode: str | None) -> str:
@@ -83,15 +97,7 @@ def exec_badge_kind(mode: str | None) -> str:
 
 
 def exec_label(mode: str | None) -> str:
-    mapping = {
-        "native_sdk": "Native SDK",
-        "native_sdk_agentic": "Agentic",
-        "codex_sdk": "Codex SDK",
-        "codex_unavailable": "Unavailable",
-        "deterministic_fallback": "Fallback",
-        "deterministic": "Deterministic",
-    }
-    return mapping.get(mode or "", (mode or "unknown").replace("_", " ").title())
+    return _EXEC_LABELS.get(mode or "", (mode or "unknown").replace("_", " ").title())
 
 
 def bool_badge(label: str, value: object) -> BadgePill:
@@ -8,7 +8,7 @@ from collections import Counter
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Chunk:
     """A chunk of paper text with its section header."""
 
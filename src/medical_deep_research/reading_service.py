@@ -45,6 +45,12 @@ class ReadingService:
     def __init__(self, database: AppDatabase) -> None:
         self.database = database
         self._paper_indices: dict[str, PaperIndex] = {}  # "{run_id}:{ref_num}"
+        # Ranked-results artifacts are immutable once a run completes, but the
+        # prompt builders re-read them on every chat turn; parse once per run.
+        self._ranked_studies_cache: dict[str, list[ScoredStudy]] = {}
+        # Reference-number index over the cached list: chat turns look studies
+        # up by [n] repeatedly, so avoid a linear scan per lookup.
+        self._studies_by_ref: dict[str, dict[int, ScoredStudy]] = {}
 
     # -- Session lifecycle --------------------------------------------------
 
@@ -87,6 +93,9 @@ class ReadingService:
     # -- Study data (from artifacts) ----------------------------------------
 
     def get_ranked_studies(self, run_id: str) -> list[ScoredStudy]:
+        cached = self._ranked_studies_cache.get(run_id)
+        if cached is not None:
+            return cached
         with self.database.session() as session:
             artifact = session.exec(
                 select(ResearchArtifact).where(
@@ -105,13 +114,16 @@ class ReadingService:
                 studies.append(ScoredStudy.model_validate(item))
             except Exception:
                 continue
+        if studies:
+            self._ranked_studies_cache[run_id] = studies
+            self._studies_by_ref[run_id] = {
+                s.reference_number: s for s in studies if s.reference_number is not None
+            }
         return studies
 
     def get_study(self, run_id: str, ref_num: int) -> ScoredStudy | None:
-        for s in self.get_ranked_studies(run_id):
-            if s.reference_number == ref_num:
-                return s
-        return None
+        self.get_ranked_studies(run_id)
+        return self._studies_by_ref.get(run_id, {}).get(ref_num)
 
     # -- Fulltext retrieval (from runtime events) ---------------------------
 
@@ -445,11 +457,10 @@ class ReadingService:
         if not chunks:
             return query
 
-        context = "RELEVANT PASSAGES FROM THE PAPER:\n\n"
-        for c in chunks:
-            section = f"[{c.header}] " if c.header else ""
-            context += f"{section}{c.text}\n\n---\n\n"
-        return f"{context}QUESTION: {query}"
+        context = "".join(
+            f"{f'[{c.header}] ' if c.header else ''}{c.text}\n\n---\n\n" for c in chunks
+        )
+        return f"RELEVANT PASSAGES FROM THE PAPER:\n\n{context}QUESTION: {query}"
 
     # -- System prompt construction (lean — no fulltext, RAG handles that) ---
 
@@ -529,18 +540,18 @@ RULES:
     def _build_cross_study_prompt(
         self, query: str, scope: str, studies: list[ScoredStudy]
     ) -> str:
-        ref_nums = [int(x) for x in scope.split(":")[1].split(",")]
+        ref_nums = {int(x) for x in scope.split(":")[1].split(",")}
         selected = [s for s in studies if s.reference_number in ref_nums]
 
-        studies_text = ""
-        for s in selected:
-            abstract_snippet = (s.abstract or "No abstract")[:300]
-            studies_text += f"""
+        studies_text = "".join(
+            f"""
 #{s.reference_number}: {s.title}
   Authors: {', '.join(s.authors[:3])} | {s.journal or 'N/A'}, {s.publication_year or 'N/A'}
   Evidence Level: {s.evidence_level or 'N/A'} | Score: {s.composite_score:.2f} | Citations: {s.citation_count}
-  Abstract: {abstract_snippet}
+  Abstract: {(s.abstract or 'No abstract')[:300]}
 """
+            for s in selected
+        )
 
         return f"""You are a reading helper comparing studies from a systematic literature review.
 
@@ -741,10 +752,12 @@ async def _stream_anthropic(
     api_key = api_keys.get("anthropic") or os.getenv("ANTHROPIC_API_KEY", "")
     client = anthropic.AsyncAnthropic(api_key=api_key)
 
+    # The system prompt is identical for every turn of a reading session, so
+    # mark it cache-eligible and let the provider skip re-processing the prefix.
     async with client.messages.stream(
         model=model,
         max_tokens=4096,
-        system=system_prompt,
+        system=[{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}],
         messages=messages,
     ) as stream:
         async for text in stream.text_stream:
@@ -764,10 +777,10 @@ async def _stream_google(
 
     # Google Genai expects a flat contents string or list of Content objects.
     # Build a simple conversation with system instruction prepended.
-    contents = f"{system_prompt}\n\n"
-    for msg in messages:
-        role_label = "User" if msg["role"] == "user" else "Assistant"
-        contents += f"{role_label}: {msg['content']}\n\n"
+    contents = f"{system_prompt}\n\n" + "".join(
+        f"{'User' if msg['role'] == 'user' else 'Assistant'}: {msg['content']}\n\n"
+        for msg in messages
+    )
 
     async for chunk in await client.aio.models.generate_content_stream(
         model=model, contents=contents,
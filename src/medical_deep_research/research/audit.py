@@ -36,7 +36,7 @@ _COUNT_PATTERNS: tuple[tuple[re.Pattern[str], str], ...] = (
     (re.compile(r"\bincluded\s+(\d+)\s+stud", re.IGNORECASE), "included"),
     (re.compile(r"\b(\d+)\s+studies\s+included\b", re.IGNORECASE), "included"),
 )
-_METHOD_COUNT_TERMS = {
+_METHOD_COUNT_TERMS = frozenset({
     "record",
     "records",
     "screened",
@@ -50,18 +50,30 @@ _METHOD_COUNT_TERMS = {
     "sources",
     "reference",
     "references",
-}
+})
+# One compiled alternation scans each sentence once instead of running a
+# substring check per term.
+_METHOD_COUNT_TERMS_RE = re.compile(
+    "|".join(map(re.escape, sorted(_METHOD_COUNT_TERMS, key=len, reverse=True)))
+)
+
+
+_REFERENCES_HEADING_RE = re.compile(
+    r"^[^\S\n]*(?:#{1,6}[^\S\n]*)?(?:\d+[.)][^\S\n]*)?(?:references|bibliography)",
+    re.IGNORECASE | re.MULTILINE,
+)
 
 
 def _split_references(report_markdown: str) -> tuple[str, str]:
-    lines = report_markdown.splitlines()
-    for index, line in enumerate(lines):
-        heading = line.strip().lower()
-        heading = re.sub(r"^#{1,6}\s*", "", heading)
-        heading = re.sub(r"^\d+[.)]\s*", "", heading)
-        if heading.startswith("references") or heading.startswith("bibliography"):
-            return "\n".join(lines[:index]), "\n".join(lines[index + 1 :])
-    return report_markdown, ""
+    match = _REFERENCES_HEADING_RE.search(report_markdown)
+    if match is None:
+        return report_markdown, ""
+    before = report_markdown[: match.start()]
+    if before.endswith("\n"):
+        before = before[:-1]
+    line_end = report_markdown.find("\n", match.end())
+    after = "" if line_end < 0 else report_markdown[line_end + 1 :]
+    return before, after
 
 
 def _valid_reference_numbers(ranked_studies: list[ScoredStudy], limit: int) -> set[int]:
@@ -236,7 +248,7 @@ def build_audit_report(
     numeric_findings = 0
     for sentence in _sentence_windows(body):
         lowered = sentence.casefold()
-        if any(term in lowered for term in _METHOD_COUNT_TERMS):
+        if _METHOD_COUNT_TERMS_RE.search(lowered):
             continue
         for match in _NUMERIC_CLAIM_RE.finditer(sentence):
             token = re.sub(r"\s+", " ", match.group(0).casefold()).strip()
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 from .models import EvidenceStudy, SourceCatalogEntry
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SourceDefinition:
     id: str
     name: str
@@ -125,9 +126,15 @@ for _definition in ALL_SOURCE_DEFINITIONS:
         _SOURCE_BY_NAME[_alias.casefold()] = _definition
 
 
+@lru_cache(maxsize=256)
 def source_definition(
     source: str, *, include_auxiliary: bool = True
 ) -> SourceDefinition | None:
+    """Resolve a source label to its definition.
+
+    Cached: the label vocabulary is small and this runs once per study in the
+    ranking and reporting paths.
+    """
     key = (source or "").strip().casefold()
     if key.startswith("europe_pmc_"):
         key = "europe_pmc"
@@ -12,16 +12,93 @@ import httpx
 
 RETRY_STATUSES = {408, 429, 500, 502, 503, 504}
 
+# Per-host circuit breaker: after this many consecutive transport failures
+# (timeouts, connection errors) the host is skipped for the cooldown period so
+# an unreachable provider fails fast instead of costing a timeout per call.
+_BREAKER_FAIL_MAX = 5
+_BREAKER_RESET_SECONDS = 60.0
+_HOST_FAILURES: dict[str, int] = {}
+_HOST_OPEN_UNTIL: dict[str, float] = {}
 
-@dataclass(frozen=True)
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a host is skipped because its circuit breaker is open."""
+
+
+@dataclass(frozen=True, slots=True)
 class RateLimit:
     min_interval_seconds: float = 0.0
 
 
 _JSON_CACHE: dict[tuple[str, str], tuple[float, Any]] = {}
+_JSON_CACHE_MAX = 512
 _HOST_LOCKS: dict[str, asyncio.Lock] = {}
 _HOST_LAST_REQUEST: dict[str, float] = {}
 
+_POOL_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+_SHARED_CLIENT: httpx.AsyncClient | None = None
+_SHARED_CLIENT_LOOP: asyncio.AbstractEventLoop | None = None
+
+
+def _close_stale_client(
+    stale: httpx.AsyncClient, stale_loop: asyncio.AbstractEventLoop | None
+) -> None:
+    """Close a pooled client left behind by an event-loop change.
+
+    The client must be closed on the loop that created it; otherwise its
+    connections stay open until process exit.
+    """
+    try:
+        if stale_loop is None or stale_loop.is_closed():
+            return
+        if stale_loop.is_running():
+            stale_loop.call_soon_threadsafe(asyncio.ensure_future, stale.aclose())
+        else:
+            stale_loop.run_until_complete(stale.aclose())
+    except Exception:  # pragma: no cover - defensive
+        pass
+
+
+def _shared_client() -> httpx.AsyncClient:
+    """Return the process-wide pooled client, rebuilding it if the loop changed.
+
+    Reusing one client keeps TLS sessions and keep-alive connections warm
+    across the many small API calls a run makes, instead of paying a full
+    handshake per request.
+    """
+    global _SHARED_CLIENT, _SHARED_CLIENT_LOOP
+    loop = asyncio.get_running_loop()
+    if _SHARED_CLIENT is None or _SHARED_CLIENT.is_closed or _SHARED_CLIENT_LOOP is not loop:
+        if _SHARED_CLIENT is not None and not _SHARED_CLIENT.is_closed:
+            _close_stale_client(_SHARED_CLIENT, _SHARED_CLIENT_LOOP)
+        _SHARED_CLIENT = httpx.AsyncClient(timeout=None, limits=_POOL_LIMITS)
+        _SHARED_CLIENT_LOOP = loop
+    return _SHARED_CLIENT
+
+
+async def prewarm_connections(urls: tuple[str, ...] | list[str], *, timeout: float = 5.0) -> None:
+    """Open keep-alive connections to the given URLs ahead of first use.
+
+    Any response (including 4xx) warms the pool; failures are ignored so a
+    slow or unreachable host never delays the caller.
+    """
+
+    async def _touch(url: str) -> None:
+        try:
+            await request("HEAD", url, timeout=timeout, retries=0)
+        except Exception:
+            pass
+
+    await asyncio.gather(*(_touch(url) for url in urls))
+
+
+async def aclose_shared_client() -> None:
+    global _SHARED_CLIENT, _SHARED_CLIENT_LOOP
+    if _SHARED_CLIENT is not None and not _SHARED_CLIENT.is_closed:
+        await _SHARED_CLIENT.aclose()
+    _SHARED_CLIENT = None
+    _SHARED_CLIENT_LOOP = None
+
 
 def clear_http_cache() -> None:
     _JSON_CACHE.clear()
@@ -31,6 +108,35 @@ def reset_rate_limits() -> None:
     _HOST_LAST_REQUEST.clear()
 
 
+def reset_circuit_breakers() -> None:
+    _HOST_FAILURES.clear()
+    _HOST_OPEN_UNTIL.clear()
+
+
+def _check_circuit(host: str) -> None:
+    open_until = _HOST_OPEN_UNTIL.get(host)
+    if open_until is None:
+        return
+    if time.monotonic() < open_until:
+        raise CircuitOpenError(
+            f"Skipping {host}: circuit open after {_BREAKER_FAIL_MAX} consecutive failures."
+        )
+    # Cooldown elapsed; allow one probe through (half-open).
+    _HOST_OPEN_UNTIL.pop(host, None)
+
+
+def _record_transport_failure(host: str) -> None:
+    failures = _HOST_FAILURES.get(host, 0) + 1
+    _HOST_FAILURES[host] = failures
+    if failures >= _BREAKER_FAIL_MAX:
+        _HOST_OPEN_UNTIL[host] = time.monotonic() + _BREAKER_RESET_SECONDS
+        _HOST_FAILURES[host] = 0
+
+
+def _record_transport_success(host: str) -> None:
+    _HOST_FAILURES.pop(host, None)
+
+
 def _cache_key(url: str, params: Mapping[str, object] | None) -> tuple[str, str]:
     if not params:
         return (url, "")
@@ -43,7 +149,12 @@ def _host(url: str) -> str:
     return parsed.netloc or parsed.path
 
 
-async def _respect_rate_limit(url: str, rate_limit: RateLimit | None) -> None:
+async def respect_rate_limit(url: str, rate_limit: RateLimit | None) -> None:
+    """Sleep as needed to keep per-host request spacing under the limit.
+
+    Shared by request() and callers that drive their own httpx client (the
+    NCBI XML path) so all traffic to a host is paced together.
+    """
     if not rate_limit or rate_limit.min_interval_seconds <= 0:
         return
     host = _host(url)
@@ -81,22 +192,58 @@ async def request(
     transport: httpx.AsyncBaseTransport | None = None,
 ) -> httpx.Response:
     attempts = max(1, retries + 1)
+    host = _host(url)
     response: httpx.Response | None = None
-    async with httpx.AsyncClient(
-        timeout=timeout,
-        headers=dict(headers or {}),
-        transport=transport,
-    ) as client:
-        for attempt in range(attempts):
-            await _respect_rate_limit(url, rate_limit)
-            response = await client.request(method, url, params=params)
-            if response.status_code not in RETRY_STATUSES or attempt == attempts - 1:
-                return response
-            await asyncio.sleep(_retry_delay(response, attempt, backoff_base))
+    if transport is not None:
+        # Explicit transports (tests) get a dedicated client so they never
+        # touch the shared pool.
+        async with httpx.AsyncClient(
+            timeout=timeout,
+            headers=dict(headers or {}),
+            transport=transport,
+        ) as client:
+            for attempt in range(attempts):
+                await respect_rate_limit(url, rate_limit)
+                response = await _guarded_request(
+                    client, method, url, host, params=params
+                )
+                if response.status_code not in RETRY_STATUSES or attempt == attempts - 1:
+                    return response
+                await asyncio.sleep(_retry_delay(response, attempt, backoff_base))
+        assert response is not None
+        return response
+
+    client = _shared_client()
+    for attempt in range(attempts):
+        await respect_rate_limit(url, rate_limit)
+        response = await _guarded_request(
+            client, method, url, host, params=params, headers=headers, timeout=timeout
+        )
+        if response.status_code not in RETRY_STATUSES or attempt == attempts - 1:
+            return response
+        await asyncio.sleep(_retry_delay(response, attempt, backoff_base))
     assert response is not None
     return response
 
 
+async def _guarded_request(
+    client: httpx.AsyncClient, method: str, url: str, host: str, **kwargs: Any
+) -> httpx.Response:
+    """Issue one request through the per-host circuit breaker.
+
+    Only transport-level errors trip the breaker; a host that answers with an
+    HTTP error status is still up and keeps its circuit closed.
+    """
+    _check_circuit(host)
+    try:
+        response = await client.request(method, url, **kwargs)
+    except httpx.HTTPError:
+        _record_transport_failure(host)
+        raise
+    _record_transport_success(host)
+    return response
+
+
 async def get_json(
     url: str,
     *,
@@ -133,10 +280,27 @@ async def get_json(
     data = response.json()
     valid = bool(data) and (looks_valid(data) if looks_valid else True)
     if cache_ttl and valid:
+        if len(_JSON_CACHE) >= _JSON_CACHE_MAX:
+            _evict_json_cache(now)
         _JSON_CACHE[key] = (now + cache_ttl, data)
     return data
 
 
+def _evict_json_cache(now: float) -> None:
+    """Drop expired entries; if still full, drop the soonest-to-expire ones.
+
+    Keeps the cache bounded so a long session of varied queries cannot grow
+    process memory without limit.
+    """
+    expired = [key for key, (expires_at, _) in _JSON_CACHE.items() if expires_at <= now]
+    for key in expired:
+        _JSON_CACHE.pop(key, None)
+    overflow = len(_JSON_CACHE) - _JSON_CACHE_MAX + 1
+    if overflow > 0:
+        for key in sorted(_JSON_CACHE, key=lambda key: _JSON_CACHE[key][0])[:overflow]:
+            _JSON_CACHE.pop(key, None)
+
+
 async def get_text(
     url: str,
     *,
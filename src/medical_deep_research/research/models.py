@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class QueryPlan(BaseModel):
@@ -79,6 +79,10 @@ class ScoredStudy(EvidenceStudy):
 
 
 class VerificationDetail(BaseModel):
+    # Built once per checked study and never edited; frozen instances skip
+    # per-field setattr validation machinery.
+    model_config = ConfigDict(frozen=True)
+
     reference_number: int | None = None
     title: str
     pmid: str | None = None
@@ -110,6 +114,8 @@ class PrismaSummary(BaseModel):
 
 
 class AuditFinding(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     code: str
     severity: str
     claim: str | None = None
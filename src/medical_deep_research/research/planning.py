@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import json
 import re
+from functools import lru_cache
 from typing import Any
 
 from .models import QueryPlan
 
 
-HEALTHCARE_RESEARCH_KEYWORDS = {
+HEALTHCARE_RESEARCH_KEYWORDS = frozenset({
     "policy",
     "ethics",
     "informatics",
@@ -17,9 +19,9 @@ HEALTHCARE_RESEARCH_KEYWORDS = {
     "workflow",
     "public health",
     "health literacy",
-}
+})
 
-CLINICAL_KEYWORDS = {
+CLINICAL_KEYWORDS = frozenset({
     "trial",
     "meta-analysis",
     "systematic review",
@@ -31,9 +33,9 @@ CLINICAL_KEYWORDS = {
     "randomised",
     "cohort",
     "intervention",
-}
+})
 
-STOP_WORDS = {
+STOP_WORDS = frozenset({
     "about",
     "adult",
     "adults",
@@ -51,7 +53,7 @@ STOP_WORDS = {
     "these",
     "this",
     "with",
-}
+})
 
 AI_EDUCATION_TERMS = (
     "AI",
@@ -103,14 +105,14 @@ COMMUNICATION_SDM_TERMS = (
     "doctor-patient communication",
     "physician-patient communication",
 )
-FRAMEWORK_LABELS = {
+FRAMEWORK_LABELS = frozenset({
     "population",
     "intervention",
     "comparison",
     "outcome",
     "concept",
     "context",
-}
+})
 _STRUCTURED_FIELD_ORDER = (
     "population",
     "intervention",
@@ -125,6 +127,8 @@ _STRUCTURED_FIELD_RE = re.compile(
     re.I | re.S,
 )
 
+_KEYWORD_SPLIT_RE = re.compile(r"[,\s]+")
+
 
 def normalize_query(query: str) -> str:
     return " ".join(query.strip().split())
@@ -181,8 +185,10 @@ def structured_query_text(query: str, query_payload: dict[str, Any] | None = Non
 def extract_keywords(query: str, limit: int = 8) -> list[str]:
     seen: set[str] = set()
     keywords: list[str] = []
-    for token in re.split(r"\s+", normalize_query(query).replace(",", " ")):
-        lowered = token.strip().lower().strip("()[]{}.:;!?")
+    # Split on commas and whitespace in one compiled pass instead of copying
+    # the query through replace() first.
+    for token in _KEYWORD_SPLIT_RE.split(normalize_query(query)):
+        lowered = token.lower().strip("()[]{}.:;!?")
         if len(lowered) < 4 or lowered in STOP_WORDS or lowered in FRAMEWORK_LABELS or lowered in seen:
             continue
         seen.add(lowered)
@@ -274,22 +280,32 @@ def _split_structured_terms(value: str, *, limit: int = 8) -> list[str]:
     return terms
 
 
-def _expanded_pubmed_terms(term: str) -> list[str]:
-    lowered = term.lower().strip()
-    expansions = {
-        "ai": ["AI", "artificial intelligence"],
-        "ai-supported": ["AI", "artificial intelligence"],
-        "ai supported": ["AI", "artificial intelligence"],
-        "machine learning": ["machine learning"],
-        "patient-centered": ["patient-centered", "patient-centred"],
-        "patient centered": ["patient-centered", "patient-centred"],
-    }
-    return expansions.get(lowered, [term])
+# Keyed by lowercased term; built once so hot query-building loops do a
+# single dict lookup instead of rebuilding the table per term.
+_PUBMED_TERM_EXPANSIONS: dict[str, tuple[str, ...]] = {
+    "ai": ("AI", "artificial intelligence"),
+    "ai-supported": ("AI", "artificial intelligence"),
+    "ai supported": ("AI", "artificial intelligence"),
+    "machine learning": ("machine learning",),
+    "patient-centered": ("patient-centered", "patient-centred"),
+    "patient centered": ("patient-centered", "patient-centred"),
+}
 
 
-def _contains_any(text: str, terms: tuple[str, ...]) -> bool:
-    lowered = text.lower()
-    return any(term.lower() in lowered for term in terms)
+def _expanded_pubmed_terms(term: str) -> tuple[str, ...]:
+    expanded = _PUBMED_TERM_EXPANSIONS.get(term.lower().strip())
+    return expanded if expanded is not None else (term,)
+
+
+def _term_pattern(terms: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile one alternation matching any term, so scans are single-pass."""
+    escaped = sorted({term.lower() for term in terms}, key=len, reverse=True)
+    return re.compile("|".join(re.escape(term) for term in escaped))
+
+
+_AI_EDUCATION_PATTERN = _term_pattern(AI_EDUCATION_TERMS)
+_AI_EDUCATION_ACTIVITY_PATTERN = _term_pattern(AI_EDUCATION_ACTIVITY_TERMS)
+_COMMUNICATION_SDM_PATTERN = _term_pattern(COMMUNICATION_SDM_TERMS)
 
 
 def _pubmed_group(terms: list[str]) -> str:
@@ -326,16 +342,23 @@ def is_ai_communication_education_query(
         )
         if part
     )
+    lowered = text.lower()
     if query_type and query_type.lower() == "pcc":
-        return _contains_any(text, AI_EDUCATION_TERMS) and _contains_any(text, COMMUNICATION_SDM_TERMS)
-    return (
-        _contains_any(text, AI_EDUCATION_TERMS)
-        and _contains_any(text, AI_EDUCATION_ACTIVITY_TERMS)
-        and _contains_any(text, COMMUNICATION_SDM_TERMS)
+        return bool(
+            _AI_EDUCATION_PATTERN.search(lowered)
+            and _COMMUNICATION_SDM_PATTERN.search(lowered)
+        )
+    return bool(
+        _AI_EDUCATION_PATTERN.search(lowered)
+        and _AI_EDUCATION_ACTIVITY_PATTERN.search(lowered)
+        and _COMMUNICATION_SDM_PATTERN.search(lowered)
     )
 
 
+@lru_cache(maxsize=1)
 def _ai_communication_pubmed_query() -> str:
+    # Built entirely from module constants; cache so repeat plan builds skip
+    # the term expansion and group assembly.
     groups = [
         _pubmed_group(list(AI_EDUCATION_TERMS)),
         _pubmed_group(list(AI_EDUCATION_ACTIVITY_TERMS)),
@@ -344,6 +367,7 @@ def _ai_communication_pubmed_query() -> str:
     return " AND ".join(group for group in groups if group)
 
 
+@lru_cache(maxsize=1)
 def _ai_communication_general_query() -> str:
     terms = (
         "artificial intelligence",
@@ -430,12 +454,32 @@ def convert_to_scopus_query(pubmed_query: str) -> str:
     return f"TITLE-ABS-KEY({query})"
 
 
+# Planning is deterministic, so identical inputs always produce the same plan.
+# Several tools and runtimes rebuild the plan for the same run; memoize it and
+# hand out copies because callers may rewrite source queries in place.
+_PLAN_CACHE: dict[tuple[str, str, str, str], QueryPlan] = {}
+_PLAN_CACHE_MAX = 64
+
+
+def clear_plan_cache() -> None:
+    """Reset the memoized query plans (used by tests)."""
+    _PLAN_CACHE.clear()
+
+
 def build_query_plan(
     query: str,
     query_type: str,
     provider: str,
     query_payload: dict[str, Any] | None = None,
 ) -> QueryPlan:
+    payload_key = (
+        json.dumps(query_payload, sort_keys=True, default=str) if query_payload else ""
+    )
+    cache_key = (query, query_type, provider, payload_key)
+    cached = _PLAN_CACHE.get(cache_key)
+    if cached is not None:
+        return cached.model_copy(deep=True)
+
     structured_fields = _structured_fields_from_payload(query_payload) or parse_structured_query(query)
     normalized_query = structured_query_text(query, structured_fields)
     keywords = extract_keywords(normalized_query, limit=10)
@@ -471,7 +515,7 @@ def build_query_plan(
     if "Scopus" in databases and not scopus_query:
         notes.append("Scopus was requested but no valid Scopus query could be derived.")
 
-    return QueryPlan(
+    plan = QueryPlan(
         query=query,
         query_type=query_type,
         provider=provider,
@@ -483,3 +527,7 @@ def build_query_plan(
         source_queries=source_queries,
         notes=notes,
     )
+    if len(_PLAN_CACHE) >= _PLAN_CACHE_MAX:
+        _PLAN_CACHE.pop(next(iter(_PLAN_CACHE)))
+    _PLAN_CACHE[cache_key] = plan.model_copy(deep=True)
+    return plan
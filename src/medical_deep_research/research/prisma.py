@@ -7,15 +7,23 @@ from .models import EvidenceStudy, PrismaSummary, ScoredStudy, SearchProviderRes
 from .scoring import deduplicate_studies
 
 
-def _rankable_studies(
+def _partition_rankable_studies(
     search_results: list[SearchProviderResult],
-) -> list[EvidenceStudy]:
-    studies: list[EvidenceStudy] = []
+) -> tuple[list[EvidenceStudy], int]:
+    """Split identified records into rankable studies and a non-rankable count.
+
+    Single pass: the rankability predicate inspects every source alias per
+    study, so it should run once per record, not once per consumer.
+    """
+    rankable: list[EvidenceStudy] = []
+    non_rankable_total = 0
     for result in search_results:
-        studies.extend(
-            study for study in result.studies if is_rankable_evidence_study(study)
-        )
-    return studies
+        for study in result.studies:
+            if is_rankable_evidence_study(study):
+                rankable.append(study)
+            else:
+                non_rankable_total += 1
+    return rankable, non_rankable_total
 
 
 def build_prisma_summary(
@@ -30,13 +38,8 @@ def build_prisma_summary(
         result.source: len(result.studies) for result in search_results
     }
     identified_total = sum(identified_by_source.values())
-    non_rankable_total = sum(
-        1
-        for result in search_results
-        for study in result.studies
-        if not is_rankable_evidence_study(study)
-    )
-    deduplicated = deduplicate_studies(_rankable_studies(search_results))
+    rankable, non_rankable_total = _partition_rankable_studies(search_results)
+    deduplicated = deduplicate_studies(rankable)
     deduplicated_count = len(deduplicated)
 
     excluded_records: list[dict[str, object]] = []
@@ -12,6 +12,8 @@ from .models import QueryPlan, ScoredStudy, SearchProviderResult, VerificationSu
 # without silently dropping citable references.
 MAX_REPORT_STUDIES = 30
 
+_DOI_URL_PREFIX_RE = re.compile(r"^https?://(dx\.)?doi\.org/")
+
 
 def _vancouver_author(name: str) -> str:
     """Normalize a single author name to Vancouver style ("Surname II")."""
@@ -60,19 +62,17 @@ def format_vancouver_citation(study: ScoredStudy) -> str:
     if journal:
         journal_part = journal.rstrip(". ")
         if study.publication_year:
-            journal_part += f". {study.publication_year}"
-            if study.volume:
-                journal_part += f";{study.volume}"
-                if study.issue:
-                    journal_part += f"({study.issue})"
-                if study.pages:
-                    journal_part += f":{study.pages}"
+            # Issue and pages only render when a volume anchors them.
+            issue = f"({study.issue})" if study.issue else ""
+            pages = f":{study.pages}" if study.pages else ""
+            volume_part = f";{study.volume}{issue}{pages}" if study.volume else ""
+            journal_part = f"{journal_part}. {study.publication_year}{volume_part}"
         parts.append(journal_part + ".")
     elif study.publication_year:
         parts.append(f"{study.publication_year}.")
 
     if study.doi:
-        doi = re.sub(r"^https?://(dx\.)?doi\.org/", "", study.doi.strip())
+        doi = _DOI_URL_PREFIX_RE.sub("", study.doi.strip())
         parts.append(f"doi:{doi}.")
     if study.pmid:
         parts.append(f"PMID: {study.pmid}.")
@@ -100,8 +100,12 @@ def _render_methods(plan: QueryPlan, results: list[SearchProviderResult]) -> lis
     skipped = []
     failed = []
     total_hits = 0
+    # Index once, keeping the first result per source like the old linear scan.
+    results_by_source: dict[str, SearchProviderResult] = {}
+    for result in results:
+        results_by_source.setdefault(result.source, result)
     for source in plan.databases:
-        matched = next((result for result in results if result.source == source), None)
+        matched = results_by_source.get(source)
         if matched is None:
             skipped.append(source)
             continue
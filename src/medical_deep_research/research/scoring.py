@@ -3,13 +3,14 @@ from __future__ import annotations
 import math
 import re
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Any
 
 from .models import EvidenceStudy, ScoredStudy
 from .planning import _structured_fields_from_payload, parse_structured_query, structured_query_text
 
 
-_RELEVANCE_STOP_WORDS = {
+_RELEVANCE_STOP_WORDS = frozenset({
     "about",
     "adult",
     "adults",
@@ -45,7 +46,7 @@ _RELEVANCE_STOP_WORDS = {
     "using",
     "versus",
     "with",
-}
+})
 
 _SYNONYM_GROUPS: tuple[tuple[str, ...], ...] = (
     (
@@ -141,33 +142,45 @@ def get_citation_score(citation_count: int | None) -> float:
     return min(math.log(citation_count + 1) / math.log(1000), 1.0)
 
 
-def get_recency_score(publication_date: str | None, half_life_years: int = 5) -> float:
+def get_recency_score(
+    publication_date: str | None,
+    half_life_years: int = 5,
+    *,
+    now: datetime | None = None,
+) -> float:
+    # ``now`` lets batch callers sample the clock once instead of per study.
     if not publication_date:
         return 0.5
     raw = publication_date.strip()
     for fmt in ("%Y-%m-%d", "%Y-%b-%d", "%Y-%B-%d", "%Y-%m", "%Y"):
         try:
             parsed = datetime.strptime(raw, fmt).replace(tzinfo=UTC)
-            years_old = (datetime.now(UTC) - parsed).days / 365.25
+            years_old = ((now or datetime.now(UTC)) - parsed).days / 365.25
             return max(pow(0.5, years_old / half_life_years), 0.1)
         except ValueError:
             continue
     return 0.5
 
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
 def _normalize_text(text: str) -> str:
-    return re.sub(r"\s+", " ", text.lower()).strip()
+    return _WHITESPACE_RE.sub(" ", text.lower()).strip()
 
 
 def _tokenize(text: str) -> set[str]:
+    # Lowercase once: abstracts run to tens of KB and this is called per study.
+    lowered = text.lower()
     tokens = {
         token
-        for token in re.findall(r"[a-z0-9]+", text.lower())
+        for token in _TOKEN_RE.findall(lowered)
         if len(token) >= 3 and token not in _RELEVANCE_STOP_WORDS
     }
-    if "llm" in text.lower():
+    if "llm" in lowered:
         tokens.add("llm")
-    if "ai" in text.lower():
+    if "ai" in lowered:
         tokens.add("ai")
     return tokens
 
@@ -194,34 +207,56 @@ def _query_fields(query: str | None, query_payload: dict[str, Any] | None) -> di
     return _structured_fields_from_payload(query_payload) or parse_structured_query(query)
 
 
-def _contains_synonym_term(text: str, term: str) -> bool:
-    return re.search(rf"(?<![a-z0-9]){re.escape(term.lower())}(?![a-z0-9])", text) is not None
+def _synonym_group_pattern(group: tuple[str, ...]) -> re.Pattern[str]:
+    # Longest alternatives first so "type 2 diabetes" wins over "diabetes".
+    alternation = "|".join(re.escape(term.lower()) for term in sorted(group, key=len, reverse=True))
+    return re.compile(rf"(?<![a-z0-9])(?:{alternation})(?![a-z0-9])")
 
 
-def _synonym_hits(needles: str, haystack: str) -> float | None:
-    lowered_needles = needles.lower()
-    for group in _SYNONYM_GROUPS:
-        if not any(_contains_synonym_term(lowered_needles, term) for term in group):
-            continue
-        return 1.0 if any(_contains_synonym_term(haystack, term) for term in group) else 0.0
-    return None
+# One compiled alternation per synonym group: matching runs once per study
+# per query field, and a single C-level sweep replaces a Python loop of
+# per-term regex searches.
+_SYNONYM_GROUP_PATTERNS: tuple[re.Pattern[str], ...] = tuple(
+    _synonym_group_pattern(group) for group in _SYNONYM_GROUPS
+)
+
+
+@lru_cache(maxsize=256)
+def _prepared_query_terms(terms: str) -> tuple[str, int, frozenset[str], bool]:
+    """Precompute the query-side half of term matching.
+
+    Term strings come from the (constant) query while matching runs once per
+    study, so normalisation, synonym-group detection, and tokenisation are
+    hoisted here. Returns (normalized, synonym group index or -1, tokens,
+    is multi-word).
+    """
+    normalized = _normalize_text(terms)
+    if not normalized:
+        return ("", -1, frozenset(), False)
+    for index, pattern in enumerate(_SYNONYM_GROUP_PATTERNS):
+        if pattern.search(normalized) is not None:
+            return (normalized, index, frozenset(), False)
+    return (normalized, -1, frozenset(_tokenize(normalized)), len(normalized.split()) > 1)
+
+
+@lru_cache(maxsize=256)
+def _query_text_tokens(text: str) -> frozenset[str]:
+    return frozenset(_tokenize(text))
 
 
 def _term_match_score(terms: str, haystack: str, haystack_tokens: set[str]) -> float:
-    normalized_terms = _normalize_text(terms)
+    normalized_terms, group_index, tokens, multi_word = _prepared_query_terms(terms)
     if not normalized_terms:
         return 0.5
 
-    synonym_score = _synonym_hits(normalized_terms, haystack)
-    if synonym_score is not None:
-        return synonym_score
+    if group_index >= 0:
+        return 1.0 if _SYNONYM_GROUP_PATTERNS[group_index].search(haystack) is not None else 0.0
 
-    tokens = _tokenize(normalized_terms)
     if not tokens:
         return 0.5
     matched = sum(1 for token in tokens if token in haystack_tokens or token in haystack)
     score = matched / len(tokens)
-    if len(normalized_terms.split()) > 1 and normalized_terms in haystack:
+    if multi_word and normalized_terms in haystack:
         score = max(score, 0.9)
     return min(score, 1.0)
 
@@ -247,7 +282,7 @@ def get_relevance_score(
     outcome_text = fields.get("outcome") or fields.get("context") or ""
     is_pcc_like = bool(fields.get("concept") and fields.get("context") and not fields.get("intervention"))
 
-    query_tokens = _tokenize(normalized_query)
+    query_tokens = _query_text_tokens(normalized_query)
     query_score = (
         sum(1 for token in query_tokens if token in haystack_tokens or token in haystack) / len(query_tokens)
         if query_tokens
@@ -323,10 +358,11 @@ def score_and_rank_results(
 ) -> list[ScoredStudy]:
     deduped = deduplicate_studies(studies)
     scored: list[ScoredStudy] = []
+    now = datetime.now(UTC)
     for study in deduped:
         evidence_level_score = get_evidence_level_score(study.evidence_level)
         citation_score = get_citation_score(study.citation_count)
-        recency_score = get_recency_score(study.publication_date or study.publication_year, 3 if context == "clinical" else 5)
+        recency_score = get_recency_score(study.publication_date or study.publication_year, 3 if context == "clinical" else 5, now=now)
         relevance_score = get_relevance_score(study, query=query, query_payload=query_payload)
         if context == "clinical":
             base_score = (
@@ -3,13 +3,16 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Awaitable, Callable
 from datetime import datetime
+from functools import lru_cache
 import re
+import time
 import xml.etree.ElementTree as ET
+from typing import Any
 
 import httpx
 
 from .connectors import canonical_source_name, is_rankable_evidence_study
-from .http import RateLimit, get_json
+from .http import RateLimit, get_json, prewarm_connections, respect_rate_limit
 from .models import EvidenceStudy, SearchProviderResult
 
 
@@ -27,7 +30,7 @@ SEMANTIC_SCHOLAR_FIELDS = (
 HTTP_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
 POLITE_EMAIL = "medical-deep-research@users.noreply.github.com"
 USER_AGENT = f"MedicalDeepResearch/2.9.12 (mailto:{POLITE_EMAIL})"
-LANDMARK_JOURNALS = {
+LANDMARK_JOURNALS = frozenset({
     "new england journal of medicine",
     "nejm",
     "n engl j med",
@@ -42,30 +45,80 @@ LANDMARK_JOURNALS = {
     "ann intern med",
     "annals of internal medicine",
     "nature medicine",
-}
+})
+
+# One C-level sweep over the journal name instead of a Python loop of
+# substring checks; this runs once per parsed study across every provider.
+_LANDMARK_JOURNALS_RE = re.compile(
+    "|".join(map(re.escape, sorted(LANDMARK_JOURNALS, key=len, reverse=True)))
+)
+
+
+# NCBI E-utilities allow 3 requests/second without an API key and 10 with one.
+_NCBI_KEYLESS_RATE_LIMIT = RateLimit(1 / 3)
+_NCBI_KEYED_RATE_LIMIT = RateLimit(0.1)
+
+
+def _ncbi_rate_limit(api_key: str | None) -> RateLimit:
+    return _NCBI_KEYED_RATE_LIMIT if api_key else _NCBI_KEYLESS_RATE_LIMIT
+
+
+PREWARM_URLS = (
+    NCBI_BASE_URL,
+    OPENALEX_BASE_URL,
+    EUROPE_PMC_REST_BASE_URL,
+    CROSSREF_BASE_URL,
+    CLINICALTRIALS_BASE_URL,
+)
+
+
+async def prewarm_search_hosts() -> None:
+    """Warm keep-alive connections to the hosts most runs query first."""
+    await prewarm_connections(PREWARM_URLS, timeout=5.0)
 
 
 def is_landmark_journal(journal: str | None) -> bool:
     if not journal:
         return False
-    lowered = journal.lower()
-    return any(landmark in lowered for landmark in LANDMARK_JOURNALS)
+    return _LANDMARK_JOURNALS_RE.search(journal.lower()) is not None
+
+
+# All level markers fused into one pattern (named group = level) so a title
+# is scanned once per study instead of once per level; the branch order keeps
+# "case-control" matching III ahead of IV's "case series".
+_EVIDENCE_MARKERS_RE = re.compile(
+    r"(?P<I>systematic\s*review|meta[\s-]?analysis)"
+    r"|(?P<II>randomized|randomised|rct\b|clinical trial)"
+    r"|(?P<III>cohort|case[\s-]?control|prospective|retrospective)"
+    r"|(?P<IV>case\s*(?:series|report)|cross-sectional)"
+)
+_EVIDENCE_LEVEL_PRIORITY = {"I": 1, "II": 2, "III": 3, "IV": 4}
+
+
+@lru_cache(maxsize=1024)
+def _title_evidence_marker(lowered: str) -> str | None:
+    """Find the highest-level marker in a lowered title.
+
+    Cached: the same study typically arrives from several providers, so
+    duplicate titles are scanned once per run instead of once per source.
+    """
+    best: str | None = None
+    for match in _EVIDENCE_MARKERS_RE.finditer(lowered):
+        group = match.lastgroup or ""
+        if best is None or _EVIDENCE_LEVEL_PRIORITY[group] < _EVIDENCE_LEVEL_PRIORITY[best]:
+            best = group
+            if best == "I":
+                break
+    return best
 
 
 def infer_evidence_level(title: str | None, publication_types: list[str] | None = None) -> str | None:
-    lowered = (title or "").lower()
-    types = [item.lower() for item in (publication_types or [])]
-    if re.search(r"systematic\s*review|meta[\s-]?analysis", lowered):
+    # A "review" publication type guarantees Level I regardless of what the
+    # title scan would find, so check it first and skip the scan entirely.
+    if any(item.lower() == "review" for item in (publication_types or [])):
         return "Level I"
-    if "review" in types:
-        return "Level I"
-    if re.search(r"randomized|randomised|rct\b|clinical trial", lowered):
-        return "Level II"
-    if re.search(r"cohort|case[\s-]?control|prospective|retrospective", lowered):
-        return "Level III"
-    if re.search(r"case\s*(series|report)|cross-sectional", lowered):
-        return "Level IV"
-    return None
+    best = _title_evidence_marker((title or "").lower())
+    return f"Level {best}" if best else None
 
 
 def reconstruct_abstract(inverted_index: dict[str, list[int]] | None) -> str | None:
@@ -143,9 +196,11 @@ async def _ncbi_get_with_retries(
     *,
     params: dict[str, object],
     attempts: int = 3,
+    rate_limit: RateLimit | None = None,
 ) -> httpx.Response:
     response: httpx.Response | None = None
     for attempt in range(attempts):
+        await respect_rate_limit(url, rate_limit)
         response = await client.get(url, params=params)
         if response.status_code not in {429, 500, 502, 503, 504}:
             return response
@@ -257,6 +312,7 @@ async def search_pubmed(
                 client,
                 f"{NCBI_BASE_URL}/esearch.fcgi",
                 params=params,
+                rate_limit=_ncbi_rate_limit(api_key),
             )
             search_response.raise_for_status()
             ids = search_response.json().get("esearchresult", {}).get("idlist", [])
@@ -276,6 +332,7 @@ async def search_pubmed(
                 client,
                 f"{NCBI_BASE_URL}/efetch.fcgi",
                 params=fetch_params,
+                rate_limit=_ncbi_rate_limit(api_key),
             )
             fetch_response.raise_for_status()
 
@@ -612,6 +669,7 @@ async def search_pmc(
                 client,
                 f"{NCBI_BASE_URL}/esearch.fcgi",
                 params=params,
+                rate_limit=_ncbi_rate_limit(api_key),
             )
             search_response.raise_for_status()
             ids = search_response.json().get("esearchresult", {}).get("idlist", [])
@@ -631,6 +689,7 @@ async def search_pmc(
                 client,
                 f"{NCBI_BASE_URL}/esummary.fcgi",
                 params=common_params,
+                rate_limit=_ncbi_rate_limit(api_key),
             )
             summary_response.raise_for_status()
 
@@ -1281,6 +1340,18 @@ _SEARCH_SOURCE_HANDLERS: dict[str, SearchSourceHandler] = {
 }
 
 
+# Agentic runs frequently repeat a (source, query) search across passes;
+# cache successful provider results for a short window so the repeat costs a
+# copy instead of a network round trip.
+_SEARCH_CACHE: dict[tuple[Any, ...], tuple[float, SearchProviderResult]] = {}
+_SEARCH_CACHE_TTL = 300.0
+_SEARCH_CACHE_MAX = 128
+
+
+def clear_search_cache() -> None:
+    _SEARCH_CACHE.clear()
+
+
 async def search_source(
     source: str,
     query: str,
@@ -1297,7 +1368,24 @@ async def search_source(
     handler = _SEARCH_SOURCE_HANDLERS.get(canonical or "")
     if handler is None:
         return SearchProviderResult(source=source, query=query, skipped=True, error="Unsupported source")
-    return await handler(
+
+    cache_key = (
+        canonical,
+        query,
+        max_results,
+        domain,
+        start_year,
+        scopus_view,
+        tuple(sorted(name for name, value in key_map.items() if value)),
+    )
+    now = time.monotonic()
+    if not offline_mode:
+        cached = _SEARCH_CACHE.get(cache_key)
+        if cached and cached[0] > now:
+            # Deep copy so downstream merging/mutation never leaks into the cache.
+            return cached[1].model_copy(deep=True)
+
+    result = await handler(
         query,
         key_map,
         max_results,
@@ -1306,6 +1394,12 @@ async def search_source(
         start_year,
         scopus_view,
     )
+    if not offline_mode and not result.skipped and not result.error and result.studies:
+        if len(_SEARCH_CACHE) >= _SEARCH_CACHE_MAX:
+            oldest = min(_SEARCH_CACHE, key=lambda key: _SEARCH_CACHE[key][0])
+            _SEARCH_CACHE.pop(oldest, None)
+        _SEARCH_CACHE[cache_key] = (now + _SEARCH_CACHE_TTL, result.model_copy(deep=True))
+    return result
 
 
 def flatten_studies(
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 import re
 from typing import Any
 
 import httpx
 
+from .http import RateLimit, respect_rate_limit
 from .models import ScoredStudy, VerificationDetail, VerificationSummary
-from .search import HTTP_TIMEOUT, NCBI_BASE_URL, POLITE_EMAIL
+from .search import HTTP_TIMEOUT, NCBI_BASE_URL, POLITE_EMAIL, _ncbi_rate_limit
 
 
 def empty_verification_summary(note: str | None = None) -> VerificationSummary:
@@ -25,6 +27,7 @@ async def verify_pmid_in_pubmed(pmid: str, api_key: str | None = None) -> tuple[
     params = {"db": "pubmed", "id": pmid, "retmode": "json"}
     if api_key:
         params["api_key"] = api_key
+    await respect_rate_limit(f"{NCBI_BASE_URL}/esummary.fcgi", _ncbi_rate_limit(api_key))
     async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
         response = await client.get(f"{NCBI_BASE_URL}/esummary.fcgi", params=params)
         response.raise_for_status()
@@ -46,6 +49,7 @@ async def verify_pmids_in_pubmed(
     if api_key:
         params["api_key"] = api_key
 
+    await respect_rate_limit(f"{NCBI_BASE_URL}/esummary.fcgi", _ncbi_rate_limit(api_key))
     async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
         response = await client.get(f"{NCBI_BASE_URL}/esummary.fcgi", params=params)
         response.raise_for_status()
@@ -110,6 +114,7 @@ async def fetch_pubmed_citation_metadata(
     params = {"db": "pubmed", "id": ",".join(unique_pmids), "retmode": "json"}
     if api_key:
         params["api_key"] = api_key
+    await respect_rate_limit(f"{NCBI_BASE_URL}/esummary.fcgi", _ncbi_rate_limit(api_key))
     async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
         response = await client.get(f"{NCBI_BASE_URL}/esummary.fcgi", params=params)
         response.raise_for_status()
@@ -133,14 +138,26 @@ def _crossref_author(author: dict[str, Any]) -> str:
     return f"{family} {initials}".strip()
 
 
+# Same spacing search_crossref uses; keeps all api.crossref.org traffic paced
+# together through the shared per-host limiter.
+_CROSSREF_RATE_LIMIT = RateLimit(0.1)
+
+# Cap on concurrent Crossref lookups when enriching a report's citations, so a
+# full bibliography (MAX_REPORT_STUDIES DOIs) never opens that many sockets at
+# once even though the per-host limiter already spaces the requests.
+_CROSSREF_ENRICH_CONCURRENCY = 4
+
+
 async def fetch_crossref_citation_metadata(doi: str) -> dict[str, Any] | None:
     """Fetch canonical citation metadata for a DOI via the Crossref REST API."""
     doi = re.sub(r"^https?://(dx\.)?doi\.org/", "", (doi or "").strip())
     if not doi:
         return None
     headers = {"User-Agent": f"medical-deep-research/1.0 (mailto:{POLITE_EMAIL})"}
+    url = f"https://api.crossref.org/works/{doi}"
+    await respect_rate_limit(url, _CROSSREF_RATE_LIMIT)
     async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
-        response = await client.get(f"https://api.crossref.org/works/{doi}", headers=headers)
+        response = await client.get(url, headers=headers)
         if response.status_code != 200:
             return None
         message = response.json().get("message", {})
@@ -212,13 +229,31 @@ async def enrich_report_citations(
             pmid_meta = await fetch_pubmed_citation_metadata(pmids, api_key=ncbi_key)
         except Exception:  # pragma: no cover - defensive network path
             pmid_meta = {}
+    # Crossref lookups are independent per DOI; fetch them concurrently
+    # instead of serialising one round trip per cited study, but bound the
+    # fan-out so a full bibliography cannot flood the host.
+    remaining_dois = list(
+        dict.fromkeys(
+            study.doi
+            for study in studies
+            if study.doi and not pmid_meta.get(study.pmid or "")
+        )
+    )
+    doi_meta: dict[str, dict[str, Any] | None] = {}
+    if remaining_dois:
+        semaphore = asyncio.Semaphore(_CROSSREF_ENRICH_CONCURRENCY)
+
+        async def _fetch_doi(doi: str) -> None:
+            async with semaphore:
+                try:
+                    doi_meta[doi] = await fetch_crossref_citation_metadata(doi)
+                except Exception:  # pragma: no cover - defensive network path
+                    doi_meta[doi] = None
+
+        await asyncio.gather(*(_fetch_doi(doi) for doi in remaining_dois))
+
     for study in studies:
-        meta = pmid_meta.get(study.pmid or "")
-        if not meta and study.doi:
-            try:
-                meta = await fetch_crossref_citation_metadata(study.doi)
-            except Exception:  # pragma: no cover - defensive network path
-                meta = None
+        meta = pmid_meta.get(study.pmid or "") or doi_meta.get(study.doi or "")
         _apply_citation_meta(study, meta)
 
 
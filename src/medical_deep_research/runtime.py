@@ -11,6 +11,7 @@ import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from contextlib import contextmanager, suppress
+from functools import lru_cache
 from json import JSONDecodeError
 from pathlib import Path
 from typing import Any, AsyncIterator, Iterator, TypeVar
@@ -93,6 +94,10 @@ CODEX_AGENTIC_TIMEOUT_SECONDS = 1800.0
 CODEX_AGENTIC_HEARTBEAT_SECONDS = 15.0
 CODEX_AGENTIC_MAX_TOOL_TURNS = 50
 CODEX_FULLTEXT_PARSE_LIMIT = 8
+# Only this many recent tool observations ever reach the decision prompt, so
+# older entries (up to ~7 KB each) are dropped instead of accumulating over
+# all CODEX_AGENTIC_MAX_TOOL_TURNS turns.
+CODEX_OBSERVATION_WINDOW = 8
 CODEX_REQUIRED_MCP_TOOLS = {"aggregate_search", "rank_results", "verify_results", "synthesize_report"}
 CODEX_PHASE1_MCP_TOOLS = {"aggregate_search", "rank_results"}
 CODEX_PHASE2_MCP_TOOLS = {"verify_results", "synthesize_report"}
@@ -660,7 +665,13 @@ def _coerce_model_output(payload: Any, output_model: type[TModel]) -> TModel:
     raise TypeError(f"Unsupported provider output type: {type(payload).__name__}")
 
 
+@lru_cache(maxsize=None)
 def _strict_json_schema_for_model(output_model: type[BaseModel]) -> dict[str, Any]:
+    """Build (once per model class) the tightened schema for structured output.
+
+    Cached: the Codex decision loop requests the same schema on every tool
+    turn. Callers pass the result to the SDK unchanged and must not mutate it.
+    """
     schema = output_model.model_json_schema()
 
     def is_map_schema(node: Any) -> bool:
@@ -889,45 +900,60 @@ class DeterministicRuntime(ResearchRuntime):
             agent_name=self.search_agent_name,
         )
 
+        # Source searches are independent, so launch them all and then
+        # consume the results in the fixed source order: wall time drops from
+        # the sum of per-source latencies to the slowest source, while the
+        # emitted event order stays deterministic.
         provider_results: list[SearchProviderResult] = []
-        for source in plan.databases:
-            source_query = plan.source_queries.get(source, plan.normalized_query)
-            yield _ev(
-                tracker,
-                EventType.TOOL_CALLED,
-                "searching",
-                f"Searching {source}",
-                tool_name=_source_tool_name(source),
-                extra={"query": source_query},
-            )
-            result = await search_source(
-                source,
-                source_query,
-                api_keys=request.api_keys,
-                max_results=DEFAULT_SEARCH_RESULTS_PER_SOURCE,
-                offline_mode=request.offline_mode,
-                domain=plan.domain,
-                start_year=request.search_start_year,
-                scopus_view=request.scopus_view,
-            )
-            provider_results.append(result)
-            yield _ev(
-                tracker,
-                EventType.TOOL_RESULT,
-                "searching",
-                f"{source} completed with {len(result.studies)} studies",
-                tool_name=_source_tool_name(source),
-                extra={"error": result.error, "skipped": result.skipped, "count": len(result.studies)},
-            )
-            yield _ev(
-                tracker,
-                EventType.ARTIFACT_CREATED,
-                "searching",
-                f"Captured {source} search results",
-                artifact_type=ArtifactType.SEARCH_RESULTS,
-                artifact_name=f"{source} Results",
-                artifact_json=result.model_dump(),
-            )
+        search_tasks: dict[str, asyncio.Task[SearchProviderResult]] = {}
+        try:
+            for source in plan.databases:
+                source_query = plan.source_queries.get(source, plan.normalized_query)
+                search_tasks[source] = asyncio.create_task(
+                    search_source(
+                        source,
+                        source_query,
+                        api_keys=request.api_keys,
+                        max_results=DEFAULT_SEARCH_RESULTS_PER_SOURCE,
+                        offline_mode=request.offline_mode,
+                        domain=plan.domain,
+                        start_year=request.search_start_year,
+                        scopus_view=request.scopus_view,
+                    ),
+                    name=f"search-{source}",
+                )
+                yield _ev(
+                    tracker,
+                    EventType.TOOL_CALLED,
+                    "searching",
+                    f"Searching {source}",
+                    tool_name=_source_tool_name(source),
+                    extra={"query": source_query},
+                )
+            for source in plan.databases:
+                result = await search_tasks[source]
+                provider_results.append(result)
+                yield _ev(
+                    tracker,
+                    EventType.TOOL_RESULT,
+                    "searching",
+                    f"{source} completed with {len(result.studies)} studies",
+                    tool_name=_source_tool_name(source),
+                    extra={"error": result.error, "skipped": result.skipped, "count": len(result.studies)},
+                )
+                yield _ev(
+                    tracker,
+                    EventType.ARTIFACT_CREATED,
+                    "searching",
+                    f"Captured {source} search results",
+                    artifact_type=ArtifactType.SEARCH_RESULTS,
+                    artifact_name=f"{source} Results",
+                    artifact_json=result.model_dump(),
+                )
+        finally:
+            for task in search_tasks.values():
+                if not task.done():
+                    task.cancel()
 
         yield _ev(
             tracker,
@@ -1150,7 +1176,11 @@ class AgenticFailureFallbackRuntime(DeterministicRuntime):
 
 class NativeSDKRuntime(DeterministicRuntime):
     native_agent_name: str = "Native Research Agent"
-    max_search_iterations: int = MAX_AGENT_SEARCH_ITERATIONS
+    # Bound on the search -> screen -> rewind refinement loop; tunable per
+    # deployment like the Anthropic timeout/retry knobs.
+    max_search_iterations: int = _env_int(
+        "MDR_MAX_SEARCH_ITERATIONS", MAX_AGENT_SEARCH_ITERATIONS
+    )
 
     def _execution_mode(self, request: RunRequest) -> str:
         return "deterministic_fallback" if self._should_fallback(request) else "native_sdk"
@@ -1216,7 +1246,9 @@ class NativeSDKRuntime(DeterministicRuntime):
         return sanitized if sanitized and not sanitized[0].isdigit() else f"agent_{sanitized}"
 
     def _compact_study_summary(self, study: ScoredStudy) -> dict[str, Any]:
-        abstract = (study.abstract or "").replace("\n", " ").strip()
+        # Normalise only the excerpt: abstracts run to several KB and this is
+        # built for every study on every checkpoint prompt.
+        abstract = (study.abstract or "").strip()[:500]
         return {
             "reference_number": study.reference_number,
             "title": study.title,
@@ -1229,7 +1261,7 @@ class NativeSDKRuntime(DeterministicRuntime):
             "evidence_level": study.evidence_level,
             "composite_score": study.composite_score,
             "citation_count": study.citation_count,
-            "abstract_excerpt": abstract[:500],
+            "abstract_excerpt": abstract.replace("\n", " "),
         }
 
     def _plan_summary_payload(self, plan: QueryPlan) -> dict[str, Any]:
@@ -1540,8 +1572,25 @@ class NativeSDKRuntime(DeterministicRuntime):
             )
         )
 
+        # One search cycle fans out to every planned database; the calls are
+        # independent, so issue them as one concurrent set and collect the
+        # results in plan order (mirrors the deterministic runtime).
+        search_tasks: dict[str, asyncio.Task[SearchProviderResult]] = {}
         for source in plan.databases:
             source_query = plan.source_queries.get(source, plan.normalized_query)
+            search_tasks[source] = asyncio.create_task(
+                search_source(
+                    source,
+                    source_query,
+                    api_keys=request.api_keys,
+                    max_results=DEFAULT_SEARCH_RESULTS_PER_SOURCE,
+                    offline_mode=request.offline_mode,
+                    domain=plan.domain,
+                    start_year=request.search_start_year,
+                    scopus_view=request.scopus_view,
+                ),
+                name=f"search-cycle-{iteration + 1}-{source}",
+            )
             events.append(
                 _ev(
                     tracker,
@@ -1552,16 +1601,14 @@ class NativeSDKRuntime(DeterministicRuntime):
                     extra={"query": source_query, "iteration": iteration + 1},
                 )
             )
-            result = await search_source(
-                source,
-                source_query,
-                api_keys=request.api_keys,
-                max_results=DEFAULT_SEARCH_RESULTS_PER_SOURCE,
-                offline_mode=request.offline_mode,
-                domain=plan.domain,
-                start_year=request.search_start_year,
-                scopus_view=request.scopus_view,
-            )
+        for source in plan.databases:
+            try:
+                result = await search_tasks[source]
+            except BaseException:
+                for task in search_tasks.values():
+                    if not task.done():
+                        task.cancel()
+                raise
             provider_results.append(result)
             events.append(
                 _ev(
@@ -2826,13 +2873,18 @@ def _codex_usage_payload(result: Any) -> dict[str, Any]:
     return {"token_usage": str(usage)}
 
 
+# Hoisted to module scope: _codex_tool_phase runs once per streamed codex
+# tool event, so the mapping should not be rebuilt per call.
+_CODEX_TOOL_PHASES: dict[str, str] = {
+    "aggregate_search": "searching",
+    "rank_results": "ranking",
+    "verify_results": "verifying",
+    "synthesize_report": "synthesizing",
+}
+
+
 def _codex_tool_phase(tool_name: str) -> str:
-    return {
-        "aggregate_search": "searching",
-        "rank_results": "ranking",
-        "verify_results": "verifying",
-        "synthesize_report": "synthesizing",
-    }.get(tool_name, "searching")
+    return _CODEX_TOOL_PHASES.get(tool_name, "searching")
 
 
 def _codex_display_tool(server: str | None, tool_name: str) -> str:
@@ -3234,9 +3286,23 @@ async def _codex_fetch_fulltext_for_ranked_studies(
         if isinstance(item, dict) and str(item.get("rank") or "").isdigit()
     ] if isinstance(available, list) else []
     parsed_fulltext: list[dict[str, Any]] = []
+    # Parse the independent ranks concurrently (download + extraction are
+    # I/O-bound); tool results are still reported in rank order.
+    parse_tasks: dict[int, asyncio.Task[dict[str, Any]]] = {}
     for rank in parse_ranks[:CODEX_FULLTEXT_PARSE_LIMIT]:
         await bridge.on_tool_start("parse_pdf", {"rank": rank})
-        parse_result = await tool_parse_pdf(request, bridge, rank, allow_user_checkpoint=False)
+        parse_tasks[rank] = asyncio.create_task(
+            tool_parse_pdf(request, bridge, rank, allow_user_checkpoint=False),
+            name=f"parse-pdf-{rank}",
+        )
+    for rank, parse_task in parse_tasks.items():
+        try:
+            parse_result = await parse_task
+        except BaseException:
+            for pending in parse_tasks.values():
+                if not pending.done():
+                    pending.cancel()
+            raise
         await bridge.on_tool_end("parse_pdf", parse_result)
         await _drain_bridge_events(bridge, progress_queue)
         if isinstance(parse_result, dict) and isinstance(parse_result.get("fulltext"), str):
@@ -3254,7 +3320,9 @@ async def _codex_fetch_fulltext_for_ranked_studies(
     return result
 
 
+@lru_cache(maxsize=1)
 def _codex_local_tool_catalog() -> str:
+    """Cached: the tool catalog is constant, so render it once per process."""
     rows = [
         "plan_search {\"query\": string, \"query_type\": string}",
         "suggest_databases {\"query\": string}",
@@ -3326,7 +3394,11 @@ def _codex_state_summary(bridge: AgenticEventBridge) -> dict[str, Any]:
 
 
 def _codex_decision_prompt(request: RunRequest, bridge: AgenticEventBridge, observations: list[str], turn_index: int) -> str:
-    recent_observations = "\n\n".join(observations[-8:]) if observations else "No tool observations yet."
+    recent_observations = (
+        "\n\n".join(observations[-CODEX_OBSERVATION_WINDOW:])
+        if observations
+        else "No tool observations yet."
+    )
     remaining_turns = max(CODEX_AGENTIC_MAX_TOOL_TURNS - turn_index + 1, 0)
     urgency = (
         "You are near the tool-turn limit: stop optional exploration and call synthesize_report or submit_report next."
@@ -3950,6 +4022,7 @@ class CodexRuntime(DeterministicRuntime):
                         bridge._intermediate["agent_final_message"] = "Codex submitted an accepted final report."
                         return
                     observations.append(_codex_tool_observation(decision.tool_name, result))
+                    del observations[:-CODEX_OBSERVATION_WINDOW]
                 raise RuntimeError(
                     f"Codex exceeded {CODEX_AGENTIC_MAX_TOOL_TURNS} tool-decision turns before submit_report."
                 )
@@ -5221,10 +5294,12 @@ class AnthropicRuntime(NativeSDKRuntime):
         from langchain.agents import create_agent
 
         with _temporary_env(_provider_api_env(self.provider, request.api_keys)):
+            # Checkpoint instructions are identical across retries and search
+            # cycles, so mark them cache-eligible like the main agent prompt.
             agent = create_agent(
                 model=f"anthropic:{request.model}",
                 tools=[],
-                system_prompt=instructions,
+                system_prompt=_anthropic_cached_system_prompt(instructions),
             )
             result = await agent.ainvoke(
                 {"messages": [{"role": "user", "content": prompt}]},
@@ -6,7 +6,12 @@ from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlmodel import col, desc, select
+from sqlmodel import col, desc, func, select
+
+try:  # Optional accelerator: used for the hot event/artifact serialization.
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback is always available
+    orjson = None  # type: ignore[assignment]
 
 from .codex_auth import CodexAuthManager, CodexAuthStatus, CodexRuntimeStatus
 from .models import (
@@ -23,6 +28,7 @@ from .models import (
     utcnow,
 )
 from .persistence import AppDatabase
+from .research.search import prewarm_search_hosts
 from .model_catalog import DEFAULT_MODELS, provider_model_options
 from .provider_config import normalize_model_id
 from .runtime import RunRequest, build_runtime, describe_provider_runtime
@@ -31,17 +37,59 @@ from .runtime import RunRequest, build_runtime, describe_provider_runtime
 _UICallback = Callable[[str, str], None]  # (run_id, change_type)
 
 
+def _dumps_compact(value: Any) -> str:
+    """Compact JSON for event payloads and artifacts.
+
+    orjson walks the dict tree in native code and is markedly faster on the
+    large ranked-study artifacts; fall back to stdlib json when the extra is
+    not installed or the value contains a type orjson cannot encode.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode()
+        except TypeError:  # pragma: no cover - defensive
+            pass
+    return json.dumps(value, separators=(",", ":"))
+
+
 class ResearchService:
     def __init__(self, database: AppDatabase) -> None:
         self.database = database
         self.codex_auth = CodexAuthManager(database.settings)
         self._tasks: dict[str, asyncio.Task[None]] = {}
         self._ui_listeners: list[_UICallback] = []
+        self._prewarm_task: asyncio.Task[None] | None = None
+        # run_id -> True when more events arrived inside the coalescing window.
+        self._event_notify_pending: dict[str, bool] = {}
+        self._event_flush_tasks: dict[str, asyncio.Task[None]] = {}
 
     def add_ui_listener(self, callback: _UICallback) -> None:
         self._ui_listeners.append(callback)
 
     def _notify_ui(self, run_id: str, change_type: str) -> None:
+        # Chatty runtimes emit dozens of events per second; fan the first one
+        # out immediately, coalesce the rest of the burst, and guarantee a
+        # trailing notification so listeners never end up stale. Lifecycle
+        # change types (created/completed/...) always pass straight through.
+        if change_type == "event":
+            if run_id in self._event_notify_pending:
+                self._event_notify_pending[run_id] = True
+                return
+            self._event_notify_pending[run_id] = False
+            self._event_flush_tasks[run_id] = asyncio.create_task(
+                self._flush_event_notify(run_id)
+            )
+        self._dispatch_ui(run_id, change_type)
+
+    async def _flush_event_notify(self, run_id: str) -> None:
+        try:
+            await asyncio.sleep(0.1)
+            if self._event_notify_pending.pop(run_id, False):
+                self._dispatch_ui(run_id, "event")
+        finally:
+            self._event_flush_tasks.pop(run_id, None)
+
+    def _dispatch_ui(self, run_id: str, change_type: str) -> None:
         for cb in self._ui_listeners:
             try:
                 cb(run_id, change_type)
@@ -63,8 +111,18 @@ class ResearchService:
         with self.database.session() as session:
             return session.get(ResearchRun, run_id)
 
-    def list_events(self, run_id: str) -> list[RuntimeEvent]:
+    def list_events(self, run_id: str, *, limit: int | None = None) -> list[RuntimeEvent]:
         with self.database.session() as session:
+            if limit is not None:
+                # Fetch only the newest rows so UI refreshes stay O(limit)
+                # instead of re-reading the whole trace on every event burst.
+                statement = (
+                    select(RuntimeEvent)
+                    .where(RuntimeEvent.run_id == run_id)
+                    .order_by(desc(RuntimeEvent.sequence))
+                    .limit(limit)
+                )
+                return list(reversed(list(session.exec(statement))))
             statement = (
                 select(RuntimeEvent)
                 .where(RuntimeEvent.run_id == run_id)
@@ -226,24 +284,23 @@ class ResearchService:
         if run is None:
             return None
         events = self.list_events(run_id)
-        start_event = next((event for event in events if event.event_type == EventType.RUN_STARTED.value), None)
-        completed_event = next(
-            (event for event in reversed(events) if event.event_type == EventType.RUN_COMPLETED.value),
-            None,
-        )
-        failed_event = next(
-            (event for event in reversed(events) if event.event_type == EventType.RUN_FAILED.value),
-            None,
-        )
-        failure_tool_event = next(
-            (
-                event for event in reversed(events)
-                if event.event_type == EventType.TOOL_RESULT.value
+        # One pass instead of four scans: keep the first start event and the
+        # latest completion/failure/SDK-error events.
+        start_event = completed_event = failed_event = failure_tool_event = None
+        for event in events:
+            if event.event_type == EventType.RUN_STARTED.value:
+                if start_event is None:
+                    start_event = event
+            elif event.event_type == EventType.RUN_COMPLETED.value:
+                completed_event = event
+            elif event.event_type == EventType.RUN_FAILED.value:
+                failed_event = event
+            elif (
+                event.event_type == EventType.TOOL_RESULT.value
                 and event.payload_json
                 and "sdk_error_type" in event.payload_json
-            ),
-            None,
-        )
+            ):
+                failure_tool_event = event
 
         def parse_payload(raw: str | None) -> dict[str, Any]:
             if not raw:
@@ -334,8 +391,18 @@ class ResearchService:
             session.commit()
             session.refresh(run)
 
+        # Warm search-host connections once per session so the first search
+        # overlaps handshakes with the planning phase instead of paying them.
+        if not self.database.settings.offline_mode and self._prewarm_task is None:
+            self._prewarm_task = asyncio.create_task(
+                prewarm_search_hosts(), name="research-prewarm"
+            )
+
         task = asyncio.create_task(self._execute_run(run.id), name=f"research-run-{run.id}")
         self._tasks[run.id] = task
+        # Run state lives in SQLite; the task handle is the only process-local
+        # state, so drop it as soon as the task finishes to keep the dict bounded.
+        task.add_done_callback(lambda _task, run_id=run.id: self._tasks.pop(run_id, None))
         self._notify_ui(run.id, "run_created")
         return run
 
@@ -358,6 +425,12 @@ class ResearchService:
                 )
             )
             session.commit()
+        # Cancel the task now rather than waiting for the runtime to emit its
+        # next event: an interrupted agentic run could otherwise keep making
+        # LLM and search calls for a long while before noticing the status.
+        task = self._tasks.get(run_id)
+        if task and not task.done():
+            task.cancel()
         self._notify_ui(run_id, "run_interrupted")
 
     def cancel_run(self, run_id: str) -> None:
@@ -436,7 +509,13 @@ class ResearchService:
         try:
             async for event in runtime.stream_run(request):
                 sequence += 1
-                self._persist_event(run_id, sequence, event)
+                # SQLite commits block; run them on a worker thread so event
+                # bursts do not stall the shared Qt/asyncio loop. Awaiting
+                # each write keeps the event order intact.
+                await asyncio.to_thread(self._persist_event, run_id, sequence, event)
+                # Notify on the loop side so the coalescing timer can be
+                # scheduled and listeners run on the Qt/asyncio loop thread.
+                self._notify_ui(run_id, "event")
                 current_run = self.get_run(run_id)
                 if current_run and current_run.status in {
                     ResearchStatus.CANCELLED.value,
@@ -445,14 +524,24 @@ class ResearchService:
                     return
             self._mark_run_complete(run_id)
         except asyncio.CancelledError:
-            self.cancel_run(run_id)
+            # An interrupt already recorded its own status; do not let the
+            # cancellation path downgrade INTERRUPTED to CANCELLED.
+            current = self.get_run(run_id)
+            if current is None or current.status != ResearchStatus.INTERRUPTED.value:
+                self.cancel_run(run_id)
             raise
         except Exception as exc:  # pragma: no cover - defensive failure path
             self._mark_run_failed(run_id, str(exc))
 
     def _persist_event(self, run_id: str, sequence: int, event: RuntimeEventPayload) -> None:
-        payload_json = json.dumps(event.extra) if event.extra else None
-        artifact_json = json.dumps(event.artifact_json) if event.artifact_json is not None else None
+        # Compact separators: event payloads and ranked-study artifacts are the
+        # hottest and largest rows we write, and the whitespace is pure cost.
+        payload_json = _dumps_compact(event.extra) if event.extra else None
+        artifact_json = (
+            _dumps_compact(event.artifact_json)
+            if event.artifact_json is not None
+            else None
+        )
         with self.database.session() as session:
             run = session.get(ResearchRun, run_id)
             if run is None:
@@ -502,7 +591,6 @@ class ResearchService:
                 )
 
             session.commit()
-        self._notify_ui(run_id, "event")
 
     def _mark_run_complete(self, run_id: str) -> None:
         with self.database.session() as session:
@@ -525,10 +613,15 @@ class ResearchService:
             run.phase = "failed"
             run.error_message = error_message
             run.completed_at = utcnow()
+            # Ask for the max sequence instead of materializing every event
+            # row just to count them; long traces run to thousands of rows.
+            last_sequence = session.exec(
+                select(func.max(RuntimeEvent.sequence)).where(RuntimeEvent.run_id == run_id)
+            ).one()
             session.add(
                 RuntimeEvent(
                     run_id=run_id,
-                    sequence=len(self.list_events(run_id)) + 1,
+                    sequence=(last_sequence or 0) + 1,
                     event_type=EventType.RUN_FAILED.value,
                     phase="failed",
                     progress=run.progress,
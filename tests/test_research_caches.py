@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+from medical_deep_research.agentic_tools import (
+    AgenticEventBridge,
+    clear_translation_cache,
+    tool_translate_report,
+)
+from medical_deep_research.models import RunRequest
+from medical_deep_research.research import planning
+from medical_deep_research.research import search
+from medical_deep_research.research.models import EvidenceStudy, SearchProviderResult
+from medical_deep_research.research.planning import build_query_plan, clear_plan_cache
+from medical_deep_research.research.search import clear_search_cache, search_source
+
+
+class PlanCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_plan_cache()
+
+    def test_repeat_plan_is_served_from_cache(self) -> None:
+        with patch.object(
+            planning, "build_pubmed_query", Mock(wraps=planning.build_pubmed_query)
+        ) as spy:
+            first = build_query_plan("statin therapy in elderly patients", "free", "openai")
+            second = build_query_plan("statin therapy in elderly patients", "free", "openai")
+        self.assertEqual(spy.call_count, 1)
+        self.assertEqual(first, second)
+
+    def test_cached_plans_are_independent_copies(self) -> None:
+        first = build_query_plan("metformin and cancer risk", "free", "openai")
+        first.source_queries["PubMed"] = "mutated"
+        first.notes.append("mutated")
+        second = build_query_plan("metformin and cancer risk", "free", "openai")
+        self.assertNotEqual(second.source_queries["PubMed"], "mutated")
+        self.assertNotIn("mutated", second.notes)
+
+    def test_clear_plan_cache_forces_rebuild(self) -> None:
+        with patch.object(
+            planning, "build_pubmed_query", Mock(wraps=planning.build_pubmed_query)
+        ) as spy:
+            build_query_plan("aspirin for primary prevention", "free", "openai")
+            clear_plan_cache()
+            build_query_plan("aspirin for primary prevention", "free", "openai")
+        self.assertEqual(spy.call_count, 2)
+
+    def test_plan_cache_stays_bounded(self) -> None:
+        for index in range(planning._PLAN_CACHE_MAX + 5):
+            build_query_plan(f"unique clinical question {index}", "free", "openai")
+        self.assertLessEqual(len(planning._PLAN_CACHE), planning._PLAN_CACHE_MAX)
+
+
+def _pubmed_result(query: str) -> SearchProviderResult:
+    return SearchProviderResult(
+        source="PubMed",
+        query=query,
+        studies=[
+            EvidenceStudy(
+                source="PubMed",
+                source_id="1",
+                title="Trial of things",
+                pmid="1",
+            )
+        ],
+    )
+
+
+class SearchCacheTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        clear_search_cache()
+
+    async def test_repeat_search_is_served_from_cache(self) -> None:
+        handler = AsyncMock(side_effect=lambda query, *args: _pubmed_result(query))
+        with patch.dict(search._SEARCH_SOURCE_HANDLERS, {"PubMed": handler}):
+            first = await search_source("PubMed", "statins")
+            # Mutating the returned copy must not leak into the cache.
+            first.studies.clear()
+            second = await search_source("PubMed", "statins")
+        self.assertEqual(handler.await_count, 1)
+        self.assertEqual(len(second.studies), 1)
+
+    async def test_failed_search_is_not_cached(self) -> None:
+        handler = AsyncMock(
+            return_value=SearchProviderResult(source="PubMed", query="x", error="429")
+        )
+        with patch.dict(search._SEARCH_SOURCE_HANDLERS, {"PubMed": handler}):
+            await search_source("PubMed", "statins")
+            await search_source("PubMed", "statins")
+        self.assertEqual(handler.await_count, 2)
+
+    async def test_expired_entry_is_refetched(self) -> None:
+        handler = AsyncMock(side_effect=lambda query, *args: _pubmed_result(query))
+        with patch.dict(search._SEARCH_SOURCE_HANDLERS, {"PubMed": handler}):
+            await search_source("PubMed", "statins")
+            for key, (_, cached) in list(search._SEARCH_CACHE.items()):
+                search._SEARCH_CACHE[key] = (0.0, cached)
+            await search_source("PubMed", "statins")
+        self.assertEqual(handler.await_count, 2)
+
+    async def test_clear_search_cache_forces_refetch(self) -> None:
+        handler = AsyncMock(side_effect=lambda query, *args: _pubmed_result(query))
+        with patch.dict(search._SEARCH_SOURCE_HANDLERS, {"PubMed": handler}):
+            await search_source("PubMed", "statins")
+            clear_search_cache()
+            await search_source("PubMed", "statins")
+        self.assertEqual(handler.await_count, 2)
+
+
+class TranslationCacheTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        clear_translation_cache()
+        self.request = RunRequest(
+            run_id="run-1",
+            query="q",
+            query_type="free",
+            mode="agentic",
+            provider="openai",
+            model="gpt-test",
+        )
+
+    async def test_repeat_translation_is_served_from_cache(self) -> None:
+        llm = AsyncMock(return_value="번역된 보고서")
+        with patch("medical_deep_research.agentic_tools._call_llm_for_translation", llm):
+            first = await tool_translate_report(
+                self.request, AgenticEventBridge(), "# Report", "ko"
+            )
+            second = await tool_translate_report(
+                self.request, AgenticEventBridge(), "# Report", "ko"
+            )
+        self.assertEqual(llm.await_count, 1)
+        self.assertEqual(first["status"], "ok")
+        self.assertTrue(second.get("cached"))
+
+    async def test_clear_translation_cache_forces_new_call(self) -> None:
+        llm = AsyncMock(return_value="번역된 보고서")
+        with patch("medical_deep_research.agentic_tools._call_llm_for_translation", llm):
+            await tool_translate_report(self.request, AgenticEventBridge(), "# Report", "ko")
+            clear_translation_cache()
+            await tool_translate_report(self.request, AgenticEventBridge(), "# Report", "ko")
+        self.assertEqual(llm.await_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
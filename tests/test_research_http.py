@@ -5,8 +5,10 @@ import unittest
 import httpx
 
 from medical_deep_research.research.http import (
+    CircuitOpenError,
     clear_http_cache,
     get_json,
+    reset_circuit_breakers,
     reset_rate_limits,
 )
 
@@ -15,6 +17,7 @@ class ResearchHttpTests(unittest.IsolatedAsyncioTestCase):
     async def asyncSetUp(self) -> None:
         clear_http_cache()
         reset_rate_limits()
+        reset_circuit_breakers()
 
     async def test_retries_retryable_status(self) -> None:
         calls = 0
@@ -53,6 +56,25 @@ class ResearchHttpTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(second, {"items": [1]})
         self.assertEqual(calls, 2)
 
+    async def test_circuit_opens_after_consecutive_transport_failures(self) -> None:
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            raise httpx.ConnectError("down", request=request)
+
+        transport = httpx.MockTransport(handler)
+        for _ in range(5):
+            with self.assertRaises(httpx.ConnectError):
+                await get_json(
+                    "https://broken.test/json", retries=0, transport=transport
+                )
+
+        with self.assertRaises(CircuitOpenError):
+            await get_json("https://broken.test/json", retries=0, transport=transport)
+        self.assertEqual(calls, 5)
+
 
 if __name__ == "__main__":
     unittest.main()
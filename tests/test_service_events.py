@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+from medical_deep_research.config import Settings
+from medical_deep_research.persistence import AppDatabase
+from medical_deep_research.service import ResearchService
+
+
+class EventNotifyCoalescingTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        settings = Settings(data_dir=Path(self._tmp_dir.name), db_filename="test.sqlite")
+        self.database = AppDatabase(settings)
+        self.database.create_all()
+        self.service = ResearchService(self.database)
+        self.notifications: list[tuple[str, str]] = []
+        self.service.add_ui_listener(
+            lambda run_id, change_type: self.notifications.append((run_id, change_type))
+        )
+
+    async def asyncTearDown(self) -> None:
+        self.database.close()
+        self._tmp_dir.cleanup()
+
+    async def test_event_burst_is_coalesced_with_trailing_notify(self) -> None:
+        for _ in range(5):
+            self.service._notify_ui("run-1", "event")
+
+        # The first event of the burst fans out immediately.
+        self.assertEqual(self.notifications, [("run-1", "event")])
+        self.assertIn("run-1", self.service._event_flush_tasks)
+
+        # The rest collapse into one trailing notification after the window.
+        await asyncio.sleep(0.2)
+        self.assertEqual(
+            self.notifications, [("run-1", "event"), ("run-1", "event")]
+        )
+        self.assertNotIn("run-1", self.service._event_flush_tasks)
+
+    async def test_lifecycle_notifications_pass_straight_through(self) -> None:
+        self.service._notify_ui("run-1", "run_created")
+        self.service._notify_ui("run-1", "run_completed")
+        self.assertEqual(
+            self.notifications,
+            [("run-1", "run_created"), ("run-1", "run_completed")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()